@@ -1,6 +1,10 @@
 import asyncio
+import hashlib
+import math
 import os
+import re
 import sqlite3
+import struct
 import sys
 import tempfile
 import threading
@@ -44,6 +48,86 @@ class _DatabaseUvicornServer(uvicorn.Server):
 
 _lock = threading.Lock()
 
+# A delta holds the pages of the database that changed since the previous store. Its header identifies the snapshot
+# the deltas apply to and its position in the chain, so that the deltas of an older snapshot are never replayed.
+_DELTA_MAGIC = b"LTDBDELTA1"
+_DELTA_HEADER = struct.Struct("<20sQIQQ")  # snapshot id, sequence, page size, number of pages, number of deltas
+_PAGE_NUMBER = struct.Struct("<Q")
+
+
+def _delta_name(db_name: str, sequence: int) -> str:
+    return f"{db_name}.{sequence:06d}.delta"
+
+
+def _is_delta_name(filename: str, db_name: str) -> bool:
+    return re.fullmatch(re.escape(db_name) + r"\.\d{6}\.delta", os.path.basename(filename)) is not None
+
+
+def _file_digest(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _backup_database(db_filename: str, backup_filename: str) -> int:
+    """Copies a consistent view of the database and returns its page size."""
+    source = sqlite3.connect(db_filename)
+    dest = sqlite3.connect(backup_filename)
+    try:
+        source.backup(dest)
+        return source.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        source.close()
+        dest.close()
+
+
+def _write_page_delta(
+    previous_filename: str,
+    current_filename: str,
+    delta_filename: str,
+    snapshot_id: bytes,
+    sequence: int,
+    page_size: int,
+) -> bool:
+    """Writes the pages of the current database differing from the previous one, returns whether any did."""
+    size = os.path.getsize(current_filename)
+    num_pages = math.ceil(size / page_size)
+    num_changed = 0
+    with open(previous_filename, "rb") as previous, open(current_filename, "rb") as current:
+        with open(delta_filename, "wb") as delta:
+            delta.write(_DELTA_MAGIC)
+            delta.write(_DELTA_HEADER.pack(snapshot_id, sequence, page_size, num_pages, 0))
+            for page_number in range(num_pages):
+                page = current.read(page_size)
+                if page != previous.read(page_size):
+                    delta.write(_PAGE_NUMBER.pack(page_number))
+                    delta.write(page)
+                    num_changed += 1
+            delta.seek(len(_DELTA_MAGIC))
+            delta.write(_DELTA_HEADER.pack(snapshot_id, sequence, page_size, num_pages, num_changed))
+    return num_changed > 0 or size != os.path.getsize(previous_filename)
+
+
+def _apply_page_delta(db_filename: str, delta_filename: str, snapshot_id: bytes, sequence: int) -> bool:
+    """Writes the pages of a delta into the database, returns False if the delta doesn't follow it."""
+    with open(delta_filename, "rb") as delta:
+        if delta.read(len(_DELTA_MAGIC)) != _DELTA_MAGIC:
+            return False
+        delta_snapshot_id, delta_sequence, page_size, num_pages, num_changed = _DELTA_HEADER.unpack(
+            delta.read(_DELTA_HEADER.size)
+        )
+        if delta_snapshot_id != snapshot_id or delta_sequence != sequence:
+            return False
+        with open(db_filename, "r+b") as db:
+            for _ in range(num_changed):
+                (page_number,) = _PAGE_NUMBER.unpack(delta.read(_PAGE_NUMBER.size))
+                db.seek(page_number * page_size)
+                db.write(delta.read(page_size))
+            db.truncate(num_pages * page_size)
+    return True
+
 
 class Database(LightningWork):
     def __init__(
@@ -52,6 +136,8 @@ class Database(LightningWork):
         db_filename: str = "database.db",
         store_interval: int = 10,
         debug: bool = False,
+        incremental_store: bool = False,
+        compaction_interval: int = 10,
     ) -> None:
         """The Database Component enables to interact with an SQLite database to store some structured information
         about your application.
@@ -64,6 +150,10 @@ class Database(LightningWork):
             store_interval: Time interval (in seconds) at which the database is periodically synchronized to the Drive.
                             Note that the database is also always synchronized on exit.
             debug: Whether to run the database in debug mode.
+            incremental_store: Whether to run the database in WAL mode and only synchronize the pages which changed
+                since the previous synchronization. The deltas are replayed on top of the last snapshot on restart.
+            compaction_interval: In incremental mode, the number of deltas after which a full snapshot of the database
+                is synchronized instead and the deltas are removed from the Drive.
 
         Example::
 
@@ -151,11 +241,21 @@ class Database(LightningWork):
         self.debug = debug
         self.store_interval = store_interval
         self._models = models if isinstance(models, list) else [models]
+        self.incremental_store = incremental_store
+        self.compaction_interval = compaction_interval
         self._store_thread = None
         self._exit_event = None
+        # the last stored database and its position in the chain of deltas of the incremental store
+        self._store_dir = None
+        self._snapshot_id = None
+        self._sequence = 0
 
     def store_database(self):
         try:
+            if self.incremental_store:
+                self._store_database_incrementally()
+                return
+
             with tempfile.TemporaryDirectory() as tmpdir:
                 tmp_db_filename = os.path.join(tmpdir, os.path.basename(self.db_filename))
 
@@ -174,6 +274,71 @@ class Database(LightningWork):
         except Exception:
             print(traceback.print_exc())
 
+    def _store_database_incrementally(self):
+        if self._store_dir is None:
+            self._store_dir = tempfile.mkdtemp()
+        db_name = os.path.basename(self.db_filename)
+        stored_filename = os.path.join(self._store_dir, db_name)
+        current_filename = os.path.join(self._store_dir, f"{db_name}.current")
+        # in WAL mode, the readers of the backup don't block the writers
+        page_size = _backup_database(self.db_filename, current_filename)
+        drive = Drive("lit://database", component_name=self.name, root_folder=self._store_dir)
+
+        if self._snapshot_id is not None:
+            delta_name = _delta_name(db_name, self._sequence + 1)
+            delta_filename = os.path.join(self._store_dir, delta_name)
+            try:
+                if not _write_page_delta(
+                    stored_filename, current_filename, delta_filename, self._snapshot_id, self._sequence + 1, page_size
+                ):
+                    return
+                if self._sequence < self.compaction_interval:
+                    drive.put(delta_name)
+                    os.replace(current_filename, stored_filename)
+                    self._sequence += 1
+                    logger.debug(f"Stored the delta {self._sequence} of the database to the Drive.")
+                    return
+            finally:
+                if os.path.exists(delta_filename):
+                    os.remove(delta_filename)
+
+        os.replace(current_filename, stored_filename)
+        drive.put(db_name)
+        # the deltas of the previous snapshot don't apply anymore
+        for filename in drive.list(component_name=self.name):
+            if _is_delta_name(filename, db_name):
+                drive.delete(os.path.basename(filename))
+        self._snapshot_id = _file_digest(stored_filename)
+        self._sequence = 0
+        logger.debug("Stored a snapshot of the database to the Drive.")
+
+    def _restore_database(self) -> None:
+        drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
+        filenames = drive.list(component_name=self.name)
+        if self.db_filename in filenames:
+            drive.get(self.db_filename)
+            print("Retrieved the database from Drive.")
+            self._replay_stored_deltas(filenames)
+
+    def _replay_stored_deltas(self, filenames: List[str]) -> None:
+        # the local WAL files don't belong to the retrieved database
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(self.db_filename + suffix):
+                os.remove(self.db_filename + suffix)
+
+        db_name = os.path.basename(self.db_filename)
+        delta_names = sorted(os.path.basename(f) for f in filenames if _is_delta_name(f, db_name))
+        if not delta_names:
+            return
+        snapshot_id = _file_digest(self.db_filename)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drive = Drive("lit://database", component_name=self.name, root_folder=tmpdir)
+            for sequence, delta_name in enumerate(delta_names, 1):
+                drive.get(delta_name, component_name=self.name)
+                if not _apply_page_delta(self.db_filename, os.path.join(tmpdir, delta_name), snapshot_id, sequence):
+                    break
+                print(f"Replayed the delta {sequence} of the database from Drive.")
+
     def periodic_store_database(self, store_interval):
         while not self._exit_event.is_set():
             with _lock:
@@ -185,15 +350,15 @@ class Database(LightningWork):
         Arguments:
             token: Token used to protect the database access. Ensure you don't expose it through the App State.
         """
-        drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
-        filenames = drive.list(component_name=self.name)
-        if self.db_filename in filenames:
-            drive.get(self.db_filename)
-            print("Retrieved the database from Drive.")
+        self._restore_database()
 
         app = FastAPI()
 
         _create_database(self.db_filename, self._models, self.debug)
+        if self.incremental_store:
+            connection = sqlite3.connect(self.db_filename)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.close()
         models = {m.__name__: m for m in self._models}
         app.post("/select_all/")(_SelectAll(models, token))
         app.post("/insert/")(_Insert(models, token))
@@ -144,9 +144,10 @@ class _LoadBalancer(LightningWork):
         self.max_batch_size = max_batch_size
         self.timeout_batching = timeout_batching
         self._iter = None
-        self._batch = []
-        self._responses = {}  # {request_id: response}
-        self._last_batch_sent = None
+        # the asyncio objects are bound to the event loop of the server, they get created in it
+        self._batch: Optional[asyncio.Queue] = None  # queue of (request_id, data, future)
+        self._server_freed: Optional[asyncio.Event] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
         self._server_status = {}
         self._api_name = api_name
         self.ready = False
@@ -171,35 +172,58 @@ class _LoadBalancer(LightningWork):
             raise ValueError("Internal IP not set")
         return f"http://{self._internal_ip}:{self._port}"
 
-    async def send_batch(self, batch: List[Tuple[str, _BatchRequestModel]], server_url: str):
+    def _get_batch_queue(self) -> asyncio.Queue:
+        if self._batch is None:
+            self._batch = asyncio.Queue()
+        return self._batch
+
+    def _get_server_freed_event(self) -> asyncio.Event:
+        if self._server_freed is None:
+            self._server_freed = asyncio.Event()
+        return self._server_freed
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # a single session is shared by all the batches to reuse the connections to the servers
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _close_session(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def send_batch(self, batch: List[Tuple[str, _BatchRequestModel, asyncio.Future]], server_url: str):
         request_data: List[_LoadBalancer._input_type] = [b[1] for b in batch]
         batch_request_data = _BatchRequestModel(inputs=request_data)
 
         try:
             self._server_status[server_url] = False
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/json",
-                }
-                async with session.post(
-                    f"{server_url}{self.endpoint}",
-                    json=batch_request_data.dict(),
-                    timeout=self._timeout_inference_request,
-                    headers=headers,
-                ) as response:
-                    if response.status == 408:
-                        raise HTTPException(408, "Request timed out")
-                    response.raise_for_status()
-                    response = await response.json()
-                    outputs = response["outputs"]
-                    if len(batch) != len(outputs):
-                        raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
-                    result = {request[0]: r for request, r in zip(batch, outputs)}
-                    self._responses.update(result)
+            headers = {
+                "accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            async with self._get_session().post(
+                f"{server_url}{self.endpoint}",
+                json=batch_request_data.dict(),
+                timeout=self._timeout_inference_request,
+                headers=headers,
+            ) as response:
+                if response.status == 408:
+                    raise HTTPException(408, "Request timed out")
+                response.raise_for_status()
+                response = await response.json()
+                outputs = response["outputs"]
+                if len(batch) != len(outputs):
+                    raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
+                for (_, _, future), output in zip(batch, outputs):
+                    # the future is cancelled if the client went away in the meantime
+                    if not future.done():
+                        future.set_result(output)
         except Exception as ex:
-            result = {request[0]: ex for request in batch}
-            self._responses.update(result)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(ex)
         finally:
             # resetting the server status so other requests can be
             # scheduled on this node
@@ -207,6 +231,7 @@ class _LoadBalancer(LightningWork):
                 # TODO - if the server returns an error, track that so
                 #  we don't send more requests to it
                 self._server_status[server_url] = True
+                self._get_server_freed_event().set()
 
     def _find_free_server(self) -> Optional[str]:
         existing = set(self._server_status.keys())
@@ -217,36 +242,51 @@ class _LoadBalancer(LightningWork):
             if status:
                 return server
 
+    async def _wait_for_free_server(self) -> str:
+        server_freed = self._get_server_freed_event()
+        while True:
+            server_freed.clear()
+            server_url = self._find_free_server()
+            if server_url is not None:
+                return server_url
+            # set when a batch completes or when servers get registered
+            await server_freed.wait()
+
     async def consumer(self):
-        """The consumer process that continuously checks for new requests and sends them to the API.
+        """The consumer process that waits for new requests and sends them to the API.
+
+        A batch is sent as soon as it holds ``max_batch_size`` requests or ``timeout_batching`` seconds after its first
+        request arrived, whichever comes first, and a server is free to process it.
 
         Two instances of this function should not be running with shared `_state_server` as that would create race
         conditions
         """
+        queue = self._get_batch_queue()
         while True:
-            await asyncio.sleep(0.05)
-            batch = self._batch[: self.max_batch_size]
-            is_batch_ready = len(batch) == self.max_batch_size
-            if len(batch) > 0 and self._last_batch_sent is None:
-                self._last_batch_sent = time.time()
-
-            if self._last_batch_sent:
-                is_batch_timeout = time.time() - self._last_batch_sent > self.timeout_batching
-            else:
-                is_batch_timeout = False
+            batch = [await queue.get()]
+            deadline = time.monotonic() + self.timeout_batching
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            server_url = await self._wait_for_free_server()
+            # the requests that arrived while waiting for a server join the batch
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            # skip the requests whose client went away
+            batch = [request for request in batch if not request[2].done()]
+            if not batch:
+                continue
 
-            server_url = self._find_free_server()
             # setting the server status to be busy! This will be reset by
             # the send_batch function after the server responds
-            if server_url is None:
-                continue
-            if batch and (is_batch_ready or is_batch_timeout):
-                self._server_status[server_url] = False
-                # find server with capacity
-                asyncio.create_task(self.send_batch(batch, server_url))
-                # resetting the batch array, TODO - not locking the array
-                self._batch = self._batch[len(batch) :]
-                self._last_batch_sent = time.time()
+            self._server_status[server_url] = False
+            asyncio.create_task(self.send_batch(batch, server_url))
 
     async def process_request(self, data: BaseModel, request_id=None):
         if request_id is None:
@@ -263,15 +303,12 @@ class _LoadBalancer(LightningWork):
         if not self._has_processing_capacity() and self._cold_start_proxy:
             return await self._cold_start_proxy.handle_request(data)
 
-        # if we have capacity, process the request
-        self._batch.append((request_id, data))
-        while True:
-            await asyncio.sleep(0.05)
-            if request_id in self._responses:
-                result = self._responses[request_id]
-                del self._responses[request_id]
-                _maybe_raise_granular_exception(result)
-                return result
+        # if we have capacity, process the request. The future gets resolved by `send_batch`
+        future = asyncio.get_running_loop().create_future()
+        self._get_batch_queue().put_nowait((request_id, data, future))
+        result = await future
+        _maybe_raise_granular_exception(result)
+        return result
 
     def _has_processing_capacity(self):
         """This function checks if we have processing capacity for one more request or not.
@@ -314,8 +351,9 @@ class _LoadBalancer(LightningWork):
             fastapi_app.SEND_TASK = asyncio.create_task(self.consumer())
 
         @fastapi_app.on_event("shutdown")
-        def shutdown_event():
+        async def shutdown_event():
             fastapi_app.SEND_TASK.cancel()
+            await self._close_session()
 
         @fastapi_app.get("/system/info", response_model=_SysInfo)
         async def sys_info():
@@ -343,6 +381,8 @@ class _LoadBalancer(LightningWork):
                 if existing not in updated_servers:
                     logger.info(f"De-Registering server {existing}", self._server_status)
                     del self._server_status[existing]
+            # wake up the consumer if it is waiting for a free server
+            self._get_server_freed_event().set()
 
         @fastapi_app.post(self.endpoint, response_model=self._output_type)
         async def balance_api(inputs: input_type):
@@ -4,13 +4,14 @@ import os
 import queue
 import sys
 import traceback
+from collections import deque
 from copy import deepcopy
 from multiprocessing import Queue
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from threading import Event, Lock, Thread
 from time import sleep
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
 
 import uvicorn
 from deepdiff import DeepDiff, Delta
@@ -32,6 +33,7 @@ from lightning_app.core.constants import (
     ENABLE_UPLOAD_ENDPOINT,
     FRONTEND_DIR,
     get_cloud_queue_type,
+    STATE_WEBSOCKET_HISTORY_SIZE,
 )
 from lightning_app.core.queues import QueuingSystem
 from lightning_app.storage import Drive
@@ -77,6 +79,74 @@ responses_store = {}
 
 logger = Logger(__name__)
 
+
+class _StateSubscription:
+    """The channel through which a websocket receives the ``(version, delta)`` published by the app."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_size: int) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        # Set when a delta had to be dropped because the client is too slow, it then needs the full state.
+        self.lagging = False
+
+    def push(self, message: Tuple[int, Dict]) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.lagging = True
+
+
+class _StateBroadcaster:
+    """Versions the states published by the app and pushes their deltas to the subscribed websockets.
+
+    The last ``history_size`` deltas are kept so that a client reconnecting with the version it last saw only
+    receives the deltas it missed, the full state is sent when it is too far behind.
+    """
+
+    def __init__(self, history_size: int = STATE_WEBSOCKET_HISTORY_SIZE) -> None:
+        self.version = 0
+        self.state: Dict = {}
+        self.history: Deque[Tuple[int, Dict]] = deque(maxlen=history_size)
+        self._subscriptions: List[_StateSubscription] = []
+        self._lock = Lock()
+
+    def publish(self, state: Dict) -> None:
+        with self._lock:
+            delta = json.loads(DeepDiff(self.state, state, verbose_level=2).to_json())
+            if not delta:
+                return
+            self.version += 1
+            self.state = state
+            self.history.append((self.version, delta))
+            for subscription in self._subscriptions:
+                subscription.loop.call_soon_threadsafe(subscription.push, (self.version, delta))
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> _StateSubscription:
+        subscription = _StateSubscription(loop, max_size=max(self.history.maxlen or 0, 1))
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: _StateSubscription) -> None:
+        with self._lock:
+            self._subscriptions.remove(subscription)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"type": "state", "version": self.version, "state": self.state}
+
+    def catch_up(self, version: int) -> List[Dict[str, Any]]:
+        """Returns the messages bringing a client from ``version`` to the current version."""
+        with self._lock:
+            if version == self.version:
+                return []
+            if self.history and 0 <= version < self.version and self.history[0][0] <= version + 1:
+                return [{"type": "delta", "version": v, "delta": delta} for v, delta in self.history if v > version]
+        return [self.snapshot()]
+
+
+state_broadcaster = _StateBroadcaster()
+
 # This can be replaced with a consumer that publishes states in a kv-store
 # in a serverless architecture
 
@@ -112,6 +182,7 @@ class UIRefresher(Thread):
             state, app_status = self.api_publish_state_queue.get(timeout=0)
             with lock:
                 global_app_state_store.set_app_state(TEST_SESSION_UUID, state)
+            state_broadcaster.publish(state)
         except queue.Empty:
             pass
 
@@ -377,23 +448,61 @@ async def healthz(response: Response):
 
 # Creates session websocket connection to notify client about any state changes
 # The websocket instance needs to be stored based on session id so it is accessible in the api layer
+# Clients connecting with a `version` query parameter receive the state deltas (or the full state when they are
+# too far behind) as JSON messages, the others only receive the new version and re-fetch the state.
 @fastapi_service.websocket("/api/v1/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     if not ENABLE_STATE_WEBSOCKET:
         await websocket.close()
         return
+    version = websocket.query_params.get("version")
+    subscription = state_broadcaster.subscribe(asyncio.get_running_loop())
     try:
-        counter = global_app_state_store.counter
-        while True:
-            if global_app_state_store.counter != counter:
-                await websocket.send_text(f"{global_app_state_store.counter}")
-                counter = global_app_state_store.counter
+        if version is None:
+            async for version, _ in _state_updates(websocket, subscription):
+                await websocket.send_text(f"{version}")
                 logger.debug("Updated websocket.")
-            await asyncio.sleep(0.01)
+            return
+
+        last_version = int(version)
+        for message in state_broadcaster.catch_up(last_version):
+            await websocket.send_json(message)
+            last_version = message["version"]
+        async for version, delta in _state_updates(websocket, subscription):
+            if subscription.lagging:
+                subscription.lagging = False
+                message = state_broadcaster.snapshot()
+            else:
+                message = {"type": "delta", "version": version, "delta": delta}
+            if message["version"] > last_version:
+                await websocket.send_json(message)
+                last_version = message["version"]
     except ConnectionClosed:
         logger.debug("Websocket connection closed")
-    await websocket.close()
+    finally:
+        state_broadcaster.unsubscribe(subscription)
+
+
+async def _state_updates(websocket: WebSocket, subscription: _StateSubscription):
+    """Yields the published ``(version, delta)`` until the client disconnects."""
+
+    async def wait_for_disconnect():
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    disconnected = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        while True:
+            update = asyncio.ensure_future(subscription.queue.get())
+            await asyncio.wait({update, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if not update.done():
+                update.cancel()
+                logger.debug("Websocket connection closed")
+                return
+            yield update.result()
+    finally:
+        disconnected.cancel()
 
 
 async def api_catch_all(request: Request, full_path: str):
@@ -6,10 +6,9 @@ import threading
 import warnings
 from copy import deepcopy
 from time import time
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 from deepdiff import DeepDiff, Delta
-from lightning_utilities.core.apply_func import apply_to_collection
 
 import lightning_app
 from lightning_app import _console
@@ -19,18 +18,20 @@ from lightning_app.core.constants import (
     FLOW_DURATION_SAMPLES,
     FLOW_DURATION_THRESHOLD,
     FRONTEND_DIR,
+    STATE_ACCUMULATE_BATCH_SIZE,
     STATE_ACCUMULATE_WAIT,
 )
 from lightning_app.core.queues import BaseQueue
 from lightning_app.core.work import LightningWork
 from lightning_app.frontend import Frontend
-from lightning_app.storage import Drive, Path, Payload
+from lightning_app.storage import Path, Payload
 from lightning_app.storage.path import _storage_root_dir
 from lightning_app.utilities import frontend
 from lightning_app.utilities.app_helpers import (
     _delta_to_app_state_delta,
     _handle_is_headless,
     _is_headless,
+    _is_state_equal,
     _LightningAppRef,
     _should_dispatch_app,
     Logger,
@@ -303,6 +304,13 @@ class LightningApp:
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_many_state_changed_from_queue(q: BaseQueue, max_items: int, timeout: Optional[int] = None) -> List[Any]:
+        try:
+            return [delta for delta in q.get_many(max_items, timeout=timeout or q.default_timeout) if delta]
+        except queue.Empty:
+            return []
+
     def check_error_queue(self) -> None:
         exception: Exception = self.get_state_changed_from_queue(self.error_queue)
         if isinstance(exception, Exception):
@@ -336,11 +344,14 @@ class LightningApp:
 
         while (time() - t0) < self.state_accumulate_wait:
 
-            # TODO: Fetch all available deltas at once to reduce queue calls.
-            delta: Optional[
+            # Fetch all the available deltas at once to reduce the queue calls.
+            received: List[
                 Union[_DeltaRequest, _APIRequest, _CommandRequest, ComponentDelta]
-            ] = self.get_state_changed_from_queue(self.delta_queue)
-            if delta:
+            ] = self.get_many_state_changed_from_queue(self.delta_queue, STATE_ACCUMULATE_BATCH_SIZE)
+            if not received:
+                break
+
+            for delta in received:
                 if isinstance(delta, _DeltaRequest):
                     deltas.append(delta.delta)
                 elif isinstance(delta, ComponentDelta):
@@ -352,12 +363,10 @@ class LightningApp:
                         logger.error(f"The component {delta.id} couldn't be accessed. Exception: {e}")
 
                     if work:
-                        delta = _delta_to_app_state_delta(self.root, work, deepcopy(delta.delta))
+                        delta = _delta_to_app_state_delta(self.root, work, delta.delta)
                         deltas.append(delta)
                 else:
                     api_or_command_request_deltas.append(delta)
-            else:
-                break
 
         if api_or_command_request_deltas:
             _process_requests(self, api_or_command_request_deltas)
@@ -384,13 +393,10 @@ class LightningApp:
         deltas = self._collect_deltas_from_ui_and_work_queues()
 
         if not deltas:
-            # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
-            last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
-            state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
             # When no deltas are received from the Rest API or work queues,
             # we need to check if the flow modified the state and populate changes.
-            deep_diff = DeepDiff(last_state, state, verbose_level=2)
-            if deep_diff:
+            # Only the presence of a change matters, the comparison stops at the first difference.
+            if not _is_state_equal(self.last_state, self.state):
                 # TODO: Resolve changes with ``CacheMissException``.
                 # new_state = self.populate_changes(self.last_state, self.state)
                 self.set_last_state(self.state)
@@ -702,6 +708,10 @@ class LightningApp:
             if state_work is None or last_state_work is None:
                 continue
 
+            # performance: most works didn't change, skip the diff for them
+            if _is_state_equal(last_state_work, state_work):
+                continue
+
             deep_diff = DeepDiff(last_state_work, state_work, verbose_level=2).to_dict()
 
             if "unprocessed" in deep_diff:
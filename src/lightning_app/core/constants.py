@@ -13,6 +13,8 @@ def get_lightning_cloud_url() -> str:
 SUPPORTED_PRIMITIVE_TYPES = (type(None), str, int, float, bool)
 STATE_UPDATE_TIMEOUT = 0.001
 STATE_ACCUMULATE_WAIT = 0.15
+# Maximum number of deltas fetched from the delta queue in a single call
+STATE_ACCUMULATE_BATCH_SIZE = 100
 # Duration in seconds of a moving average of a full flow execution
 # beyond which an exception is raised.
 FLOW_DURATION_THRESHOLD = 1.0
@@ -25,6 +27,8 @@ APP_SERVER_PORT = 7501
 APP_STATE_MAX_SIZE_BYTES = 1024 * 1024  # 1 MB
 
 WARNING_QUEUE_SIZE = 1000
+# The queue payloads larger than this number of bytes are compressed, 0 disables the compression.
+QUEUE_COMPRESSION_THRESHOLD = int(os.getenv("LIGHTNING_QUEUE_COMPRESSION_THRESHOLD", "16384"))
 # different flag because queue debug can be very noisy, and almost always not useful unless debugging the queue itself.
 QUEUE_DEBUG_ENABLED = bool(int(os.getenv("LIGHTNING_QUEUE_DEBUG_ENABLED", "0")))
 
@@ -35,6 +39,10 @@ REDIS_QUEUES_READ_DEFAULT_TIMEOUT = 0.005
 
 HTTP_QUEUE_URL = os.getenv("LIGHTNING_HTTP_QUEUE_URL", "http://localhost:9801")
 HTTP_QUEUE_REFRESH_INTERVAL = float(os.getenv("LIGHTNING_HTTP_QUEUE_REFRESH_INTERVAL", "1"))
+# Maximum duration in seconds the queue server may hold a pop request open until an item is available
+HTTP_QUEUE_LONG_POLL_TIMEOUT = float(os.getenv("LIGHTNING_HTTP_QUEUE_LONG_POLL_TIMEOUT", "10"))
+# The length of the queue is only checked for the size warning every this many puts
+HTTP_QUEUE_LENGTH_CHECK_INTERVAL = int(os.getenv("LIGHTNING_HTTP_QUEUE_LENGTH_CHECK_INTERVAL", "10"))
 HTTP_QUEUE_TOKEN = os.getenv("LIGHTNING_HTTP_QUEUE_TOKEN", None)
 
 USER_ID = os.getenv("USER_ID", "1234")
@@ -68,6 +76,8 @@ ENABLE_PUSHING_STATE_ENDPOINT = ENABLE_PULLING_STATE_ENDPOINT and bool(
     int(os.getenv("ENABLE_PUSHING_STATE_ENDPOINT", "1"))
 )
 ENABLE_STATE_WEBSOCKET = bool(int(os.getenv("ENABLE_STATE_WEBSOCKET", "0")))
+# Number of state deltas kept by the REST API so that reconnecting websocket clients only receive what they missed.
+STATE_WEBSOCKET_HISTORY_SIZE = int(os.getenv("STATE_WEBSOCKET_HISTORY_SIZE", "100"))
 ENABLE_UPLOAD_ENDPOINT = bool(int(os.getenv("ENABLE_UPLOAD_ENDPOINT", "1")))
 
 
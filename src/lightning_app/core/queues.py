@@ -3,16 +3,20 @@ import pickle
 import queue  # needed as import instead from/import for mocking in tests
 import time
 import warnings
+import zlib
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from lightning_app.core.constants import (
+    HTTP_QUEUE_LENGTH_CHECK_INTERVAL,
+    HTTP_QUEUE_LONG_POLL_TIMEOUT,
     HTTP_QUEUE_REFRESH_INTERVAL,
     HTTP_QUEUE_TOKEN,
     HTTP_QUEUE_URL,
     LIGHTNING_DIR,
+    QUEUE_COMPRESSION_THRESHOLD,
     QUEUE_DEBUG_ENABLED,
     REDIS_HOST,
     REDIS_PASSWORD,
@@ -22,12 +26,15 @@ from lightning_app.core.constants import (
     WARNING_QUEUE_SIZE,
 )
 from lightning_app.utilities.app_helpers import Logger
-from lightning_app.utilities.imports import _is_redis_available, requires
-from lightning_app.utilities.network import HTTPClient
+from lightning_app.utilities.imports import _is_redis_available, _is_zstandard_available, requires
+from lightning_app.utilities.network import _DEFAULT_REQUEST_TIMEOUT, HTTPClient
 
 if _is_redis_available():
     import redis
 
+if _is_zstandard_available():
+    import zstandard
+
 logger = Logger(__name__)
 
 
@@ -143,6 +150,66 @@ class QueuingSystem(Enum):
         return self.get_queue(queue_name)
 
 
+class QueueSerializer:
+    """Turns the items put in the remote queues into bytes and back.
+
+    The items are pickled and the payloads larger than ``compression_threshold`` bytes are compressed, with zstd
+    when ``zstandard`` is installed and zlib otherwise. The compressed payloads are tagged so that the readers decode
+    them whatever their own threshold is. Subclass it to plug another format.
+
+    Parameters
+    ----------
+    compression_threshold:
+        The size in bytes above which the payloads are compressed, 0 disables the compression.
+    """
+
+    _ZLIB_TAG = b"\x00z"
+    _ZSTD_TAG = b"\x00s"
+
+    def __init__(self, compression_threshold: int = QUEUE_COMPRESSION_THRESHOLD):
+        self.compression_threshold = compression_threshold
+
+    def dumps(self, item: Any) -> bytes:
+        from lightning_app import LightningWork
+
+        is_work = isinstance(item, LightningWork)
+
+        # TODO: Be careful to handle with a lock if another thread needs
+        # to access the work backend one day.
+        # The backend isn't picklable
+        # Raises a TypeError: cannot pickle '_thread.RLock' object
+        if is_work:
+            backend = item._backend
+            item._backend = None
+
+        value = pickle.dumps(item)
+
+        # The backend isn't pickable.
+        if is_work:
+            item._backend = backend
+
+        if self.compression_threshold and len(value) > self.compression_threshold:
+            return self._compress(value)
+        return value
+
+    def loads(self, value: bytes) -> Any:
+        # a pickle always starts with the protocol opcode, so the tags can't be mistaken for one
+        if value[:2] == self._ZLIB_TAG:
+            value = zlib.decompress(value[2:])
+        elif value[:2] == self._ZSTD_TAG:
+            if not _is_zstandard_available():
+                raise ModuleNotFoundError(
+                    "The queue payload is compressed with zstd, please run: pip install zstandard"
+                )
+            value = zstandard.ZstdDecompressor().decompress(value[2:])
+        return pickle.loads(value)
+
+    def _compress(self, value: bytes) -> bytes:
+        if _is_zstandard_available():
+            return self._ZSTD_TAG + zstandard.ZstdCompressor().compress(value)
+        return self._ZLIB_TAG + zlib.compress(value, 1)
+
+
 class BaseQueue(ABC):
     """Base Queue class that has a similar API to the Queue class in python."""
 
@@ -167,6 +234,30 @@ class BaseQueue(ABC):
         """
         pass
 
+    def put_many(self, items: List[Any]) -> None:
+        """Appends all the items to the right of the queue.
+
+        Child classes should override this method to push the items with as few calls as possible.
+        """
+        for item in items:
+            self.put(item)
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` elements from the left of the queue.
+
+        The call waits for the first element like :meth:`get` does and raises ``queue.Empty`` if none is available.
+        Child classes should override this method to also return the elements already available after the first one.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds for the first element, in case of input timeout is 0, the `self.default_timeout`
+            is used. A timeout of None can be used to block indefinitely.
+        """
+        return [self.get(timeout)]
+
     @property
     def is_running(self) -> bool:
         """Returns True if the queue is running, False otherwise.
@@ -191,6 +282,15 @@ class MultiProcessQueue(BaseQueue):
             timeout = self.default_timeout
         return self.queue.get(timeout=timeout, block=(timeout is None))
 
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        items = [self.get(timeout)]
+        while len(items) < max_items:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
 
 class RedisQueue(BaseQueue):
     @requires("redis")
@@ -201,6 +301,7 @@ class RedisQueue(BaseQueue):
         host: str = None,
         port: int = None,
         password: str = None,
+        serializer: Optional[QueueSerializer] = None,
     ):
         """
         Parameters
@@ -215,6 +316,8 @@ class RedisQueue(BaseQueue):
             The port of the redis server
         password:
             Redis password
+        serializer:
+            Turns the items into bytes and back, defaults to a :class:`QueueSerializer`.
         """
         if name is None:
             raise ValueError("You must specify a name for the queue")
@@ -223,42 +326,33 @@ class RedisQueue(BaseQueue):
         self.password = password or REDIS_PASSWORD
         self.name = name
         self.default_timeout = default_timeout
+        self.serializer = serializer or QueueSerializer()
         self.redis = redis.Redis(host=self.host, port=self.port, password=self.password)
 
     def put(self, item: Any) -> None:
-        from lightning_app import LightningWork
-
-        is_work = isinstance(item, LightningWork)
+        self.put_many([item])
 
-        # TODO: Be careful to handle with a lock if another thread needs
-        # to access the work backend one day.
-        # The backend isn't picklable
-        # Raises a TypeError: cannot pickle '_thread.RLock' object
-        if is_work:
-            backend = item._backend
-            item._backend = None
-
-        value = pickle.dumps(item)
-        queue_len = self.length()
-        if queue_len >= WARNING_QUEUE_SIZE:
-            warnings.warn(
-                f"The Redis Queue {self.name} length is larger than the "
-                f"recommended length of {WARNING_QUEUE_SIZE}. "
-                f"Found {queue_len}. This might cause your application to crash, "
-                "please investigate this."
-            )
+    def put_many(self, items: List[Any]) -> None:
+        """Appends all the items to the right of the redis queue with a single ``RPUSH``."""
+        if not items:
+            return
+        values = [self.serializer.dumps(item) for item in items]
         try:
-            self.redis.rpush(self.name, value)
+            # ``RPUSH`` returns the length of the list after the push, which saves an ``LLEN`` round trip
+            queue_len = self.redis.rpush(self.name, *values)
         except redis.exceptions.ConnectionError:
             raise ConnectionError(
                 "Your app failed because it couldn't connect to Redis. "
                 "Please try running your app again. "
                 "If the issue persists, please contact support@lightning.ai"
             )
-
-        # The backend isn't pickable.
-        if is_work:
-            item._backend = backend
+        if queue_len - len(values) >= WARNING_QUEUE_SIZE:
+            warnings.warn(
+                f"The Redis Queue {self.name} length is larger than the "
+                f"recommended length of {WARNING_QUEUE_SIZE}. "
+                f"Found {queue_len - len(values)}. This might cause your application to crash, "
+                "please investigate this."
+            )
 
     def get(self, timeout: int = None):
         """Returns the left most element of the redis queue.
@@ -287,7 +381,30 @@ class RedisQueue(BaseQueue):
 
         if out is None:
             raise queue.Empty
-        return pickle.loads(out[1])
+        return self.serializer.loads(out[1])
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        """Returns up to ``max_items`` elements from the left of the redis queue.
+
+        The first element is awaited with ``BLPOP`` as in :meth:`get`, the following ones are popped with a single
+        ``LRANGE`` and ``LTRIM`` transaction.
+        """
+        items = [self.get(timeout)]
+        if max_items <= 1:
+            return items
+        try:
+            pipe = self.redis.pipeline()
+            pipe.lrange(self.name, 0, max_items - 2)
+            pipe.ltrim(self.name, max_items - 1, -1)
+            values, _ = pipe.execute()
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+        items.extend(self.serializer.loads(value) for value in values)
+        return items
 
     def clear(self) -> None:
         """Clear all elements in the queue."""
@@ -320,6 +437,7 @@ class RedisQueue(BaseQueue):
             "host": self.host,
             "port": self.port,
             "password": self.password,
+            "serializer": self.serializer,
         }
 
     @classmethod
@@ -328,7 +446,7 @@ class RedisQueue(BaseQueue):
 
 
 class HTTPQueue(BaseQueue):
-    def __init__(self, name: str, default_timeout: float):
+    def __init__(self, name: str, default_timeout: float, serializer: Optional[QueueSerializer] = None):
         """
         Parameters
         ----------
@@ -338,65 +456,109 @@ class HTTPQueue(BaseQueue):
             the `name` argument.
         default_timeout:
             Default timeout for redis read
+        serializer:
+            Turns the items into bytes and back, defaults to a :class:`QueueSerializer`.
         """
         if name is None:
             raise ValueError("You must specify a name for the queue")
         self.app_id, self._name_suffix = self._split_app_id_and_queue_name(name)
         self.name = name  # keeping the name for debugging
         self.default_timeout = default_timeout
+        self.serializer = serializer or QueueSerializer()
+        # the session of the client keeps the connections alive across requests
         self.client = HTTPClient(base_url=HTTP_QUEUE_URL, auth_token=HTTP_QUEUE_TOKEN, log_callback=debug_log_callback)
+        self._num_puts = 0
 
     def get(self, timeout: int = None) -> Any:
+        """Returns the left most element of the queue.
+
+        The blocking reads long-poll the server: the ``timeout`` is sent along with the pop request so that the
+        server can hold it open until an element is available. If the server answers right away with an empty
+        queue, the client polls again with an exponential backoff up to ``HTTP_QUEUE_REFRESH_INTERVAL``.
+
+        Parameters
+        ----------
+        timeout:
+            Read timeout in seconds, in case of input timeout is 0, a single non-blocking request is made.
+            A timeout of None can be used to block indefinitely.
+        """
         if not self.app_id:
             raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
 
-        # it's a blocking call, we need to loop and call the backend to mimic this behavior
-        if timeout is None:
-            while True:
-                try:
-                    return self._get()
-                except queue.Empty:
-                    time.sleep(HTTP_QUEUE_REFRESH_INTERVAL)
-
         # make one request and return the result
         if timeout == 0:
             return self._get()
 
-        # timeout is some value - loop until the timeout is reached
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        backoff = 0.05
+        while True:
+            remaining = HTTP_QUEUE_LONG_POLL_TIMEOUT if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                raise queue.Empty
+            poll_timeout = min(remaining, HTTP_QUEUE_LONG_POLL_TIMEOUT)
+            start_time = time.monotonic()
             try:
-                return self._get()
+                return self._get(poll_timeout)
             except queue.Empty:
-                # Note: In theory, there isn't a need for a sleep as the queue shouldn't
-                # block the flow if the queue is empty.
-                # However, as the Http Server can saturate,
-                # let's add a sleep here if a higher timeout is provided
-                # than the default timeout
-                if timeout > self.default_timeout:
-                    time.sleep(0.05)
                 pass
-
-    def _get(self):
-        resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", query_params={"action": "pop"})
+            # the server didn't hold the request open, wait before polling again to not saturate it
+            if time.monotonic() - start_time < poll_timeout:
+                if deadline is not None:
+                    backoff = min(backoff, deadline - time.monotonic())
+                if backoff > 0:
+                    time.sleep(backoff)
+                backoff = min(backoff * 2, HTTP_QUEUE_REFRESH_INTERVAL)
+
+    def _get(self, timeout: float = 0):
+        query_params = {"action": "pop"}
+        request_timeout = None
+        if timeout > 0:
+            query_params["timeout"] = timeout
+            # the request itself can't time out before the server answers the long poll
+            request_timeout = timeout + _DEFAULT_REQUEST_TIMEOUT
+        resp = self.client.post(
+            f"v1/{self.app_id}/{self._name_suffix}", query_params=query_params, timeout=request_timeout
+        )
         if resp.status_code == 204:
             raise queue.Empty
-        return pickle.loads(resp.content)
+        return self.serializer.loads(resp.content)
+
+    def get_many(self, max_items: int, timeout: int = None) -> List[Any]:
+        items = [self.get(timeout)]
+        # pop the elements already available without waiting for new ones
+        while len(items) < max_items:
+            try:
+                items.append(self._get())
+            except queue.Empty:
+                break
+        return items
 
     def put(self, item: Any) -> None:
+        self.put_many([item])
+
+    def put_many(self, items: List[Any]) -> None:
         if not self.app_id:
             raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
-
-        value = pickle.dumps(item)
-        queue_len = self.length()
-        if queue_len >= WARNING_QUEUE_SIZE:
-            warnings.warn(
-                f"The Queue {self._name_suffix} length is larger than the recommended length of {WARNING_QUEUE_SIZE}. "
-                f"Found {queue_len}. This might cause your application to crash, please investigate this."
+        if not items:
+            return
+
+        # the length is only sampled for the size warning, once for all the items
+        if self._num_puts % HTTP_QUEUE_LENGTH_CHECK_INTERVAL == 0:
+            queue_len = self.length()
+            if queue_len >= WARNING_QUEUE_SIZE:
+                warnings.warn(
+                    f"The Queue {self._name_suffix} length is larger than the recommended length of "
+                    f"{WARNING_QUEUE_SIZE}. Found {queue_len}. This might cause your application to crash, please "
+                    "investigate this."
+                )
+        self._num_puts += 1
+        for item in items:
+            value = self.serializer.dumps(item)
+            resp = self.client.post(
+                f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"}
             )
-        resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"})
-        if resp.status_code != 201:
-            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+            if resp.status_code != 201:
+                raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
 
     def length(self):
         if not self.app_id:
@@ -422,6 +584,7 @@ class HTTPQueue(BaseQueue):
             "type": "http",
             "name": self.name,
             "default_timeout": self.default_timeout,
+            "serializer": self.serializer,
         }
 
     @classmethod
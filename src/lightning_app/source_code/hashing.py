@@ -1,10 +1,123 @@
 import hashlib
-from typing import List
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+from lightning_app.utilities.app_helpers import Logger
 
-def _get_hash(files: List[str], algorithm: str = "blake2", chunk_num_blocks: int = 128) -> str:
+logger = Logger(__name__)
+
+# The digests of the files modified less than this number of seconds before hashing aren't cached, as a write
+# within the filesystem timestamp resolution wouldn't change their size nor their modification time.
+_CACHE_MIN_FILE_AGE = 2.0
+
+
+def _new_hash(algorithm: str):
+    if algorithm == "blake2":
+        return hashlib.blake2b(digest_size=20)
+    if algorithm == "md5":
+        return hashlib.md5()
+    raise ValueError(f"Algorithm {algorithm} not supported")
+
+
+def _get_file_hash(file: str, algorithm: str = "blake2", chunk_num_blocks: int = 128) -> str:
+    """Hashes the content of a single file."""
+    h = _new_hash(algorithm)
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_num_blocks * h.block_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_hash_cache(cache_file: Optional[Path], algorithm: str) -> Dict[str, List]:
+    if cache_file is None or not cache_file.is_file():
+        return {}
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        logger.debug(f"Ignoring the corrupted hash cache {cache_file}")
+        return {}
+    if cache.get("algorithm") != algorithm:
+        return {}
+    return cache.get("files", {})
+
+
+def _save_hash_cache(cache_file: Path, algorithm: str, entries: Dict[str, List]) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump({"algorithm": algorithm, "files": entries}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # the cache is only an optimization
+        logger.debug(f"Couldn't write the hash cache {cache_file}")
+
+
+def _get_file_hashes(
+    files: List[str],
+    algorithm: str = "blake2",
+    chunk_num_blocks: int = 128,
+    root: Optional[str] = None,
+    cache_file: Optional[Path] = None,
+    num_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Hashes the content of each file with a thread pool.
+
+    The digests are returned by the posix path of the files relative to ``root``. When a ``cache_file`` is given, the
+    digest of a file is reused as long as its size, modification time and inode don't change. See :func:`_get_hash`
+    for the parameters.
+    """
+    # validate input
+    _new_hash(algorithm)
+
+    cache = _load_hash_cache(cache_file, algorithm)
+    now = time.time()
+    entries: Dict[str, List] = {}
+    digests: Dict[str, str] = {}
+    to_hash: List[Tuple[str, str, os.stat_result]] = []
+    for file in files:
+        name = Path(os.path.relpath(file, root) if root else file).as_posix()
+        stat = os.stat(file)
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = cache.get(name)
+        if entry is not None and entry[:3] == key:
+            digests[name] = entry[3]
+            entries[name] = entry
+        else:
+            to_hash.append((name, file, stat))
+
+    # hashlib releases the GIL while hashing large buffers, so the threads read and hash the files concurrently
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        hashed = executor.map(lambda item: _get_file_hash(item[1], algorithm, chunk_num_blocks), to_hash)
+        for (name, _, stat), digest in zip(to_hash, hashed):
+            digests[name] = digest
+            if now - stat.st_mtime > _CACHE_MIN_FILE_AGE:
+                entries[name] = [stat.st_size, stat.st_mtime_ns, stat.st_ino, digest]
+
+    if cache_file is not None and entries != cache:
+        _save_hash_cache(cache_file, algorithm, entries)
+    return digests
+
+
+def _get_hash(
+    files: List[str],
+    algorithm: str = "blake2",
+    chunk_num_blocks: int = 128,
+    root: Optional[str] = None,
+    cache_file: Optional[Path] = None,
+    num_workers: Optional[int] = None,
+) -> str:
     """Hashes the contents of a list of files.
 
+    The files are hashed in parallel by a thread pool, and their digests are combined with their path into a
+    single digest that doesn't depend on the order of ``files``. When a ``cache_file`` is given, the digest of a file
+    is reused as long as its size, modification time and inode don't change.
+
     Parameters
     ----------
     files: List[Path]
@@ -14,23 +127,26 @@ def _get_hash(files: List[str], algorithm: str = "blake2", chunk_num_blocks: int
         is faster than "md5". [1]
     chunk_num_blocks: int, default 128
         Block size to user when iterating over file chunks.
+    root: str, optional
+        The paths of the files are hashed relatively to this directory, so that the hash doesn't depend on where the
+        files are located.
+    cache_file: Path, optional
+        The file storing the digests of the files between the calls.
+    num_workers: int, optional
+        The number of threads hashing the files, defaults to the ``ThreadPoolExecutor`` default.
 
     References
     ----------
     [1] https://crypto.stackexchange.com/questions/70101/blake2-vs-md5-for-checksum-file-integrity
     [2] https://stackoverflow.com/questions/1131220/get-md5-hash-of-big-files-in-python
     """
-    # validate input
-    if algorithm == "blake2":
-        h = hashlib.blake2b(digest_size=20)
-    elif algorithm == "md5":
-        h = hashlib.md5()
-    else:
-        raise ValueError(f"Algorithm {algorithm} not supported")
+    digests = _get_file_hashes(files, algorithm, chunk_num_blocks, root, cache_file, num_workers)
 
     # calculate hash for all files
-    for file in files:
-        with open(file, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_num_blocks * h.block_size), b""):
-                h.update(chunk)
+    h = _new_hash(algorithm)
+    for name in sorted(digests):
+        h.update(name.encode())
+        h.update(b"\0")
+        h.update(digests[name].encode())
+        h.update(b"\n")
     return h.hexdigest()
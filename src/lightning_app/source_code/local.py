@@ -1,12 +1,13 @@
+import hashlib
 import os
 from contextlib import contextmanager
 from pathlib import Path
 from shutil import rmtree
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from lightning_app.source_code.copytree import _copytree, _IGNORE_FUNCTION
 from lightning_app.source_code.hashing import _get_hash
-from lightning_app.source_code.tar import _tar_path
+from lightning_app.source_code.tar import _tar_path_incremental
 from lightning_app.source_code.uploader import FileUploader
 
 
@@ -45,9 +46,15 @@ class LocalSourceCodeDir:
             return self._version
 
         # stores both version and a set with the files used to generate the checksum
-        self._version = _get_hash(files=self.files, algorithm="blake2")
+        self._version = _get_hash(files=self.files, algorithm="blake2", root=self.path, cache_file=self.hash_cache_path)
         return self._version
 
+    @property
+    def hash_cache_path(self) -> Path:
+        """Location of the digests of the files of this directory in local cache."""
+        key = hashlib.blake2b(str(Path(self.path).resolve()).encode(), digest_size=20).hexdigest()
+        return self.cache_location / "hashes" / f"{key}.json"
+
     @property
     def package_path(self):
         """Location to tarball in local cache."""
@@ -76,22 +83,30 @@ class LocalSourceCodeDir:
         """Packages local path using tar."""
         if self.package_path.exists():
             return self.package_path
-        # create a packaging session if not available
-        with self.packaging_session() as session_path:
-            _tar_path(source_path=session_path, target_file=str(self.package_path), compression=True)
+        # the entries of the files that didn't change since the last package are reused from the cache
+        _tar_path_incremental(
+            source_path=str(self.path),
+            files=self.files,
+            target_file=str(self.package_path),
+            cache_dir=self.cache_location / "tar_entries",
+            hash_cache_file=self.hash_cache_path,
+        )
         return self.package_path
 
-    def upload(self, url: str) -> None:
+    def upload(self, url: Union[str, Dict[int, str]]) -> Optional[Dict[int, str]]:
         """Uploads package to URL, usually pre-signed URL.
 
+        When ``url`` is a dictionary of pre-signed URLs with key as part number, the package is uploaded in parts
+        and the ETags of the parts are returned.
+
         Notes
         -----
-        Since we do not use multipart uploads here, we cannot upload any
+        Since we do not use multipart uploads with a single URL, we cannot upload any
         packaged repository files which have a size > 2GB.
 
         This limitation should be removed during the datastore upload redesign
         """
-        if self.package_path.stat().st_size > 2e9:
+        if isinstance(url, str) and self.package_path.stat().st_size > 2e9:
             raise OSError(
                 "cannot upload directory code whose total fize size is greater than 2GB (2e9 bytes)"
             ) from None
@@ -102,4 +117,4 @@ class LocalSourceCodeDir:
             name=self.package_path.name,
             total_size=self.package_path.stat().st_size,
         )
-        uploader.upload()
+        return uploader.upload()
@@ -1,14 +1,26 @@
+import gzip
+import hashlib
+import io
 import math
 import os
+import shutil
 import subprocess
 import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import click
 
+from lightning_app.source_code.hashing import _get_file_hashes
+
 MAX_SPLIT_COUNT = 999
 
+# The compressed tar entries not reused by a package for this number of seconds are removed from the cache.
+_TAR_ENTRY_CACHE_TTL = 7 * 24 * 3600
+
 
 def _get_dir_size_and_count(source_dir: str, prefix: Optional[str] = None) -> Tuple[int, int]:
     """Get size and file count of a directory.
@@ -179,3 +191,103 @@ def _tar_path_subprocess(source_path: str, target_file: str, compression: bool =
         shell=True,
         env={"GZIP": "-9", "COPYFILE_DISABLE": "1"},
     )
+
+
+def _tar_path_incremental(
+    source_path: str,
+    files: List[str],
+    target_file: str,
+    cache_dir: Path,
+    hash_cache_file: Optional[Path] = None,
+    num_workers: Optional[int] = None,
+) -> _TarResults:
+    """Create a compressed tar of ``files`` from entries compressed on their own and cached by content.
+
+    A gzip file can hold several members that are decompressed as a single stream, so each tar entry (header, data
+    and padding) is compressed as a separate member stored in ``cache_dir`` under the digest of its header and
+    content. Only the entries of the new or modified files are compressed, by a thread pool, and the tar is then
+    written by concatenating the cached members.
+
+    Parameters
+    ----------
+    source_path: str
+        Source directory, the files are added relatively to it
+    files: List[str]
+        Files to add to the tar, their parent directories are added too
+    target_file
+        Target tar file
+    cache_dir: Path
+        Directory storing the compressed entries
+    hash_cache_file: Path, optional
+        The file storing the digests of the files between the calls, see :func:`_get_hash`
+    num_workers: int, optional
+        The number of threads compressing the entries
+
+    Returns
+    -------
+    TarResults
+        Results that holds file counts and sizes
+    """
+    digests = _get_file_hashes(files, root=source_path, cache_file=hash_cache_file, num_workers=num_workers)
+    names = {"."}
+    for name in digests:
+        parent = os.path.dirname(name)
+        while parent and parent not in names:
+            names.add(parent)
+            parent = os.path.dirname(parent)
+    names.update(digests)
+
+    # only used to create the tar headers the way ``tarfile`` does
+    tar = tarfile.open(fileobj=io.BytesIO(), mode="w", format=tarfile.PAX_FORMAT)
+    entries = []
+    before_size = 0
+    for name in sorted(names):
+        path = os.path.join(source_path, name)
+        tarinfo = tar.gettarinfo(path, arcname="./" if name == "." else f"./{name}")
+        header = tarinfo.tobuf(tar.format, tar.encoding, tar.errors)
+        key = hashlib.blake2b(header + digests.get(name, "").encode(), digest_size=20).hexdigest()
+        entries.append((cache_dir / f"{key}.gz", path if tarinfo.isreg() else None, header, tarinfo.size))
+        if tarinfo.isreg():
+            before_size += tarinfo.size
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    missing = {entry[0]: entry for entry in entries if not entry[0].exists()}
+    # zlib releases the GIL while compressing, so the threads compress the entries concurrently
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(lambda entry: _write_tar_entry(*entry), missing.values()))
+
+    # the tar is only visible once complete, as an existing package is reused as is
+    tmp_file = f"{target_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        for entry_file, *_ in entries:
+            with open(entry_file, "rb") as entry:
+                shutil.copyfileobj(entry, f)
+            # mark the entry as used
+            os.utime(entry_file)
+        # end of archive
+        f.write(gzip.compress(tarfile.NUL * tarfile.BLOCKSIZE * 2))
+    os.replace(tmp_file, target_file)
+
+    _prune_tar_entries(cache_dir)
+    after_size = os.stat(target_file).st_size
+    return _TarResults(before_size=before_size, after_size=after_size)
+
+
+def _write_tar_entry(entry_file: Path, source_file: Optional[str], header: bytes, size: int) -> None:
+    tmp_file = entry_file.with_name(f"{entry_file.name}.{os.getpid()}.tmp")
+    with gzip.open(tmp_file, "wb", compresslevel=9) as f:
+        f.write(header)
+        if source_file is not None:
+            with open(source_file, "rb") as source:
+                shutil.copyfileobj(source, f)
+            remainder = size % tarfile.BLOCKSIZE
+            if remainder:
+                f.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+    os.replace(tmp_file, entry_file)
+
+
+def _prune_tar_entries(cache_dir: Path) -> None:
+    expiration = time.time() - _TAR_ENTRY_CACHE_TTL
+    for entry_file in cache_dir.iterdir():
+        if entry_file.stat().st_mtime < expiration:
+            entry_file.unlink()
@@ -1,4 +1,8 @@
+import math
+import os
 import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from typing import Dict, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -6,25 +10,72 @@ from rich.progress import BarColumn, Progress, TextColumn
 from urllib3.util.retry import Retry
 
 
+class _FilePart:
+    """A file-like view over ``size`` bytes of a file starting at ``offset``, streamed as a request body."""
+
+    def __init__(self, path: str, offset: int, size: int):
+        self._file = open(path, "rb")
+        self._offset = offset
+        self._size = size
+        self._file.seek(offset)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def tell(self) -> int:
+        return self._file.tell() - self._offset
+
+    def seek(self, position: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            position += self.tell()
+        elif whence == os.SEEK_END:
+            position += self._size
+        self._file.seek(self._offset + min(max(position, 0), self._size))
+        return self.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._size - self.tell()
+        if size < 0 or size > remaining:
+            size = remaining
+        return self._file.read(size)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "_FilePart":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
 class FileUploader:
     """This class uploads a source file with presigned url to S3.
 
+    When ``presigned_url`` is a dictionary, the file is split in as many parts of equal size as there are urls and
+    the parts are streamed from disk by ``workers`` threads. Each part is retried on its own, and the ETags of the
+    acknowledged parts are kept in ``completed_parts`` so that a failed upload can be resumed by passing them to a new
+    uploader.
+
     Attributes
     ----------
     source_file: str
         Source file to upload
     presigned_url: str
-        Presigned urls dictionary, with key as part number and values as urls
+        Presigned url, or presigned urls dictionary with key as part number and values as urls
     retries: int
         Amount of retries when requests encounter an error
     total_size: int
         Size of all files to upload
     name: str
         Name of this upload to display progress
+    completed_parts: dict
+        ETags of the parts already uploaded, with key as part number
     """
 
     workers: int = 8
     retries: int = 10000
+    part_retries: int = 5
     disconnect_retry_wait_seconds: int = 5
 
     progress = Progress(
@@ -33,11 +84,19 @@ class FileUploader:
         "[self.progress.percentage]{task.percentage:>3.1f}%",
     )
 
-    def __init__(self, presigned_url: str, source_file: str, total_size: int, name: str):
+    def __init__(
+        self,
+        presigned_url: Union[str, Dict[int, str]],
+        source_file: str,
+        total_size: int,
+        name: str,
+        completed_parts: Optional[Dict[int, str]] = None,
+    ):
         self.presigned_url = presigned_url
         self.source_file = source_file
         self.total_size = total_size
         self.name = name
+        self.completed_parts = dict(completed_parts or {})
 
     def upload_data(self, url: str, data: bytes, retries: int, disconnect_retry_wait_seconds: int) -> str:
         """Send data to url.
@@ -77,14 +136,74 @@ class FileUploader:
             raise ValueError(f"Unexpected response from {url}, response: {resp.content}")
         return resp.headers["ETag"]
 
-    def upload(self) -> None:
-        """Upload files from source dir into target path in S3."""
+    def upload_part(self, s: requests.Session, part_number: int, offset: int, size: int) -> str:
+        """Stream a part of the source file to its url, retrying the part on disconnections.
+
+        Returns
+        -------
+        str
+            ETag from response
+        """
+        url = self.presigned_url[part_number]
+        for attempt in range(self.part_retries):
+            try:
+                with _FilePart(self.source_file, offset, size) as data:
+                    return self._upload_data(s, url, data)
+            except (BrokenPipeError, requests.exceptions.ConnectionError):
+                if attempt + 1 < self.part_retries:
+                    time.sleep(self.disconnect_retry_wait_seconds)
+
+        raise ValueError(f"Unable to upload the part {part_number} of the file after multiple attempts")
+
+    def upload(self) -> Optional[Dict[int, str]]:
+        """Upload files from source dir into target path in S3.
+
+        Returns
+        -------
+        dict
+            ETags of all the parts with key as part number, needed to complete a multipart upload
+        """
         task_id = self.progress.add_task("upload", filename=self.name, total=self.total_size)
         self.progress.start()
         try:
+            if isinstance(self.presigned_url, dict):
+                return self._upload_parts(task_id)
             with open(self.source_file, "rb") as f:
                 data = f.read()
             self.upload_data(self.presigned_url, data, self.retries, self.disconnect_retry_wait_seconds)
             self.progress.update(task_id, advance=len(data))
         finally:
             self.progress.stop()
+
+    def _upload_parts(self, task_id) -> Dict[int, str]:
+        part_numbers = sorted(self.presigned_url)
+        part_size = math.ceil(self.total_size / len(part_numbers))
+        parts = {}
+        for index, part_number in enumerate(part_numbers):
+            offset = index * part_size
+            parts[part_number] = (offset, max(min(part_size, self.total_size - offset), 0))
+
+        for part_number in self.completed_parts:
+            self.progress.update(task_id, advance=parts[part_number][1])
+
+        with requests.Session() as s, ThreadPoolExecutor(max_workers=self.workers) as executor:
+            adapter = HTTPAdapter(max_retries=Retry(total=10), pool_maxsize=self.workers)
+            s.mount("https://", adapter)
+            futures = {
+                executor.submit(self.upload_part, s, part_number, offset, size): part_number
+                for part_number, (offset, size) in parts.items()
+                if part_number not in self.completed_parts
+            }
+            error = None
+            for future in as_completed(futures):
+                part_number = futures[future]
+                try:
+                    self.completed_parts[part_number] = future.result()
+                except Exception as e:
+                    # keep collecting the other parts so that the upload can be resumed from them
+                    error = error or e
+                    continue
+                self.progress.update(task_id, advance=parts[part_number][1])
+        if error is not None:
+            raise error
+        return dict(self.completed_parts)
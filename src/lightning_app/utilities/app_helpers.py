@@ -301,32 +301,55 @@ def _set_child_name(component: "Component", child: "Component", new_name: str) -
     return child_name
 
 
-def _delta_to_app_state_delta(root: "LightningFlow", component: "Component", delta: Delta) -> Delta:
-    delta_dict = delta.to_dict()
-    for changed in delta_dict.values():
-        for delta_key in changed.copy().keys():
-            val = changed[delta_key]
+def _is_state_equal(state: Any, other: Any) -> bool:
+    """Returns whether two states are equal, stopping at the first difference.
+
+    This is much cheaper than a ``DeepDiff`` when only the presence of a change matters. As with ``DeepDiff``, values
+    of different types are not equal, and the ``Path`` and ``Drive`` objects are compared through their dictionary
+    representation.
+    """
+    from lightning_app.storage import Drive, Path
+
+    if isinstance(state, (Path, Drive)):
+        state = state.to_dict()
+    if isinstance(other, (Path, Drive)):
+        other = other.to_dict()
+    if type(state) is not type(other):
+        return False
+    if isinstance(state, dict):
+        if state.keys() != other.keys():
+            return False
+        return all(_is_state_equal(value, other[key]) for key, value in state.items())
+    if isinstance(state, (list, tuple)):
+        return len(state) == len(other) and all(map(_is_state_equal, state, other))
+    try:
+        return bool(state == other)
+    except Exception:
+        return False
 
-            new_prefix = "root"
-            for p, c in _walk_to_component(root, component):
 
-                if isinstance(c, lightning_app.core.LightningWork):
-                    new_prefix += "['works']"
+def _delta_to_app_state_delta(root: "LightningFlow", component: "Component", delta: Delta) -> Delta:
+    # the prefix of the component in the app state
+    new_prefix = "root"
+    for p, c in _walk_to_component(root, component):
+
+        if isinstance(c, lightning_app.core.LightningWork):
+            new_prefix += "['works']"
 
-                if isinstance(c, lightning_app.core.LightningFlow):
-                    new_prefix += "['flows']"
+        if isinstance(c, lightning_app.core.LightningFlow):
+            new_prefix += "['flows']"
 
-                if isinstance(c, (lightning_app.structures.Dict, lightning_app.structures.List)):
-                    new_prefix += "['structures']"
+        if isinstance(c, (lightning_app.structures.Dict, lightning_app.structures.List)):
+            new_prefix += "['structures']"
 
-                c_n = c.name.split(".")[-1]
-                new_prefix += f"['{c_n}']"
+        c_n = c.name.split(".")[-1]
+        new_prefix += f"['{c_n}']"
 
-            delta_key_without_root = delta_key[4:]  # the first 4 chars are the word 'root', strip it
-            new_key = new_prefix + delta_key_without_root
-            if new_key != delta_key:
-                changed[new_key] = val
-                del changed[delta_key]
+    # the given delta is left untouched, so it doesn't need to be copied
+    delta_dict = {}
+    for category, changed in delta.to_dict().items():
+        # the first 4 chars are the word 'root', strip it
+        delta_dict[category] = {new_prefix + delta_key[4:]: val for delta_key, val in changed.items()}
 
     return Delta(delta_dict)
 
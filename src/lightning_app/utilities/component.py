@@ -1,6 +1,6 @@
 import os
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional, TYPE_CHECKING
+from typing import Any, Dict, Generator, Optional, TYPE_CHECKING, Union
 
 from deepdiff.helper import NotPresent
 from lightning_utilities.core.apply_func import apply_to_collection
@@ -56,11 +56,17 @@ def _sanitize_state(state: Dict[str, Any]) -> Dict[str, Any]:
     def sanitize_cloud_compute(cloud_compute: CloudCompute) -> Dict:
         return cloud_compute.to_dict()
 
-    state = apply_to_collection(state, dtype=Path, function=sanitize_path)
-    state = apply_to_collection(state, dtype=_BasePayload, function=sanitize_payload)
-    state = apply_to_collection(state, dtype=Drive, function=sanitize_drive)
-    state = apply_to_collection(state, dtype=CloudCompute, function=sanitize_cloud_compute)
-    return state
+    def sanitize(value: Union[Path, _BasePayload, Drive, CloudCompute]) -> Any:
+        if isinstance(value, Path):
+            return sanitize_path(value)
+        if isinstance(value, _BasePayload):
+            return sanitize_payload(value)
+        if isinstance(value, Drive):
+            return sanitize_drive(value)
+        return sanitize_cloud_compute(value)
+
+    # performance: a single traversal of the state for all the types
+    return apply_to_collection(state, dtype=(Path, _BasePayload, Drive, CloudCompute), function=sanitize)
 
 
 def _state_to_json(state: Dict[str, Any]) -> Dict[str, Any]:
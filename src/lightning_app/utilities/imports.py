@@ -144,4 +144,8 @@ def _is_aiohttp_available() -> bool:
     return module_available("aiohttp")
 
 
+def _is_zstandard_available() -> bool:
+    return module_available("zstandard")
+
+
 _CLOUD_TEST_RUN = bool(os.getenv("CLOUD", False))
@@ -196,9 +196,18 @@ class HTTPClient:
         return self.session.get(url)
 
     @_http_method_logger_wrapper
-    def post(self, path: str, *, query_params: Optional[Dict] = None, data: Optional[bytes] = None):
+    def post(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict] = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ):
         url = urljoin(self.base_url, path)
-        return self.session.post(url, data=data, params=query_params)
+        if timeout is None:
+            return self.session.post(url, data=data, params=query_params)
+        return self.session.post(url, data=data, params=query_params, timeout=timeout)
 
     @_http_method_logger_wrapper
     def delete(self, path: str):
@@ -12,7 +12,7 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import partial
 from threading import Event, Thread
-from typing import Any, Callable, Dict, Generator, Optional, Set, Tuple, Type, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Type, TYPE_CHECKING, Union
 
 from deepdiff import DeepDiff, Delta
 from lightning_utilities.core.apply_func import apply_to_collection
@@ -23,8 +23,8 @@ from lightning_app.storage.copier import _Copier, _copy_files
 from lightning_app.storage.drive import _maybe_create_drive, Drive
 from lightning_app.storage.path import _path_to_work_artifact
 from lightning_app.storage.payload import Payload
-from lightning_app.utilities.app_helpers import affiliation
-from lightning_app.utilities.component import _set_work_context
+from lightning_app.utilities.app_helpers import _is_state_equal, affiliation
+from lightning_app.utilities.component import _sanitize_state, _set_work_context
 from lightning_app.utilities.enum import (
     CacheCallsKeys,
     make_status,
@@ -42,6 +42,8 @@ from lightning_app.utilities.app_helpers import Logger
 
 logger = Logger(__name__)
 _state_observer_lock = threading.Lock()
+# the types of the state values that can be compared to their previous sanitized copy with `==`
+_COMPARABLE_STATE_TYPES = (type(None), bool, int, float, str, list, dict, tuple)
 
 
 @dataclass
@@ -264,33 +266,89 @@ class WorkStateObserver(Thread):
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_many_state_changed_from_queue(q: "BaseQueue", max_items: int = 100) -> List[Dict]:
+        try:
+            return [delta for delta in q.get_many(max_items, timeout=q.default_timeout) if isinstance(delta, dict)]
+        except queue.Empty:
+            return []
+
     def run_once(self) -> None:
         with _state_observer_lock:
             # Add all deltas the LightningWorkSetAttrProxy has processed and sent to the Flow already while
-            # the WorkStateObserver was sleeping
+            # the WorkStateObserver was sleeping. The deltas are copied as they are applied in-place.
             for delta in self._delta_memory:
-                self._last_state += delta
+                self._last_state = self._last_state + Delta(deepcopy(delta.to_dict()), mutate=True)
             self._delta_memory.clear()
 
             # The remaining delta is the result of state updates triggered outside the setattr, e.g, by a list append
-            delta = Delta(DeepDiff(self._last_state, self._work.state, verbose_level=2))
-            if not delta.to_dict():
-                return
-            self._last_state = deepcopy(self._work.state)
-            self._delta_queue.put(ComponentDelta(id=self._work.name, delta=delta))
+            delta = self._compute_delta()
+            if delta is not None:
+                self._delta_queue.put(ComponentDelta(id=self._work.name, delta=delta))
 
         if self._flow_to_work_delta_queue:
             while True:
-                deep_diff = self.get_state_changed_from_queue(self._flow_to_work_delta_queue)
-                if not isinstance(deep_diff, dict):
+                deep_diffs = self.get_many_state_changed_from_queue(self._flow_to_work_delta_queue)
+                if not deep_diffs:
                     break
-                try:
-                    with _state_observer_lock:
-                        self._work.apply_flow_delta(Delta(deep_diff, raise_errors=True))
-                except Exception as e:
-                    print(traceback.print_exc())
-                    self._error_queue.put(e)
-                    raise e
+                for deep_diff in deep_diffs:
+                    try:
+                        with _state_observer_lock:
+                            self._work.apply_flow_delta(Delta(deep_diff, raise_errors=True))
+                    except Exception as e:
+                        print(traceback.print_exc())
+                        self._error_queue.put(e)
+                        raise e
+
+    def _changed_state_vars(self) -> List[str]:
+        """Returns the names of the state variables which might differ from the last state.
+
+        JSON values are compared to their previous copy with ``_is_state_equal``, which stops at the first difference
+        and is much cheaper than diffing and copying them. The values which don't sanitize to JSON values (paths,
+        payloads) are always considered as changed.
+        """
+        last_vars = self._last_state["vars"]
+        changed = []
+        for name in list(self._work._state):
+            value = getattr(self._work, name)
+            if not isinstance(value, _COMPARABLE_STATE_TYPES):
+                # e.g. drives and cloud computes are sanitized into dictionaries
+                value = _sanitize_state({name: value})[name]
+            # the comparison is type-strict at every level, as ``DeepDiff`` reports the type changes
+            if (
+                name in last_vars
+                and isinstance(value, _COMPARABLE_STATE_TYPES)
+                and _is_state_equal(value, last_vars[name])
+            ):
+                continue
+            changed.append(name)
+        return changed
+
+    def _compute_delta(self) -> Optional[Delta]:
+        """Computes the delta between the last state and the current state of the work, only diffing and copying
+        the parts of the state that changed."""
+        names = self._changed_state_vars()
+        calls = self._work._calls
+        calls_changed = not _is_state_equal(calls, self._last_state["calls"])
+        if not names and not calls_changed:
+            return None
+
+        last_vars = self._last_state["vars"]
+        previous = {"vars": {name: last_vars[name] for name in names if name in last_vars}}
+        current = {"vars": _sanitize_state({name: getattr(self._work, name) for name in names})}
+        if calls_changed:
+            previous["calls"] = self._last_state["calls"]
+            current["calls"] = calls.copy()
+        delta = Delta(DeepDiff(previous, current, verbose_level=2))
+
+        current = deepcopy(current)
+        last_vars.update(current["vars"])
+        if calls_changed:
+            self._last_state["calls"] = current["calls"]
+
+        if not delta.to_dict():
+            return None
+        return delta
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -319,9 +377,10 @@ class LightningWorkSetAttrProxy:
     def __call__(self, name: str, value: Any) -> None:
         logger.debug(f"Setting {name}: {value}")
         with _state_observer_lock:
-            state = deepcopy(self.work.state)
+            # only the variable being set can change, there is no need to diff the whole state
+            state = deepcopy(self._state_var(name))
             self.work._default_setattr(name, value)
-            delta = Delta(DeepDiff(state, self.work.state, verbose_level=2))
+            delta = Delta(DeepDiff(state, self._state_var(name), verbose_level=2))
             if not delta.to_dict():
                 return
 
@@ -332,6 +391,12 @@ class LightningWorkSetAttrProxy:
             if self.state_observer:
                 self.state_observer._delta_memory.append(delta)
 
+    def _state_var(self, name: str) -> Dict[str, Any]:
+        """Returns the part of the work state holding the given variable, with the same structure as the state."""
+        if name not in self.work._state:
+            return {"vars": {}}
+        return {"vars": _sanitize_state({name: getattr(self.work, name)})}
+
 
 @dataclass
 class ComponentDelta:
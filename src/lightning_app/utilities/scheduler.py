@@ -26,6 +26,7 @@ class SchedulerThread(threading.Thread):
             raise e
 
     def run_once(self):
+        component_deltas = []
         for call_hash in list(self._app._schedules.keys()):
             metadata = self._app._schedules[call_hash]
             start_time = datetime.fromisoformat(metadata["start_time"])
@@ -43,8 +44,10 @@ class SchedulerThread(threading.Thread):
                         }
                     ),
                 )
-                self._app.delta_queue.put(component_delta)
+                component_deltas.append(component_delta)
                 metadata["start_time"] = next_event.isoformat()
+        if component_deltas:
+            self._app.delta_queue.put_many(component_deltas)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -15,6 +15,7 @@
 import csv
 import logging
 import os
+import time
 from argparse import Namespace
 from typing import Any, Dict, List, Optional, Union
 
@@ -41,6 +42,9 @@ class CSVLogger(Logger):
             directory for existing versions, then automatically assigns the next available version.
         prefix: A string to put at the beginning of metric keys.
         flush_logs_every_n_steps: How often to flush logs to disk (defaults to every 100 steps).
+        max_buffered_rows: Also flush the logs to disk once this many rows are waiting to be written.
+        flush_interval: Also flush the logs to disk when this many seconds have passed since the last flush.
+            Disabled by default.
 
     Example::
 
@@ -60,6 +64,8 @@ class CSVLogger(Logger):
         version: Optional[Union[int, str]] = None,
         prefix: str = "",
         flush_logs_every_n_steps: int = 100,
+        max_buffered_rows: int = 1000,
+        flush_interval: Optional[float] = None,
     ):
         super().__init__()
         self._root_dir = os.fspath(root_dir)
@@ -68,6 +74,8 @@ class CSVLogger(Logger):
         self._prefix = prefix
         self._experiment: Optional[_ExperimentWriter] = None
         self._flush_logs_every_n_steps = flush_logs_every_n_steps
+        self._max_buffered_rows = max_buffered_rows
+        self._flush_interval = flush_interval
 
     @property
     def name(self) -> str:
@@ -120,7 +128,9 @@ class CSVLogger(Logger):
             return self._experiment
 
         os.makedirs(self.root_dir, exist_ok=True)
-        self._experiment = _ExperimentWriter(log_dir=self.log_dir)
+        self._experiment = _ExperimentWriter(
+            log_dir=self.log_dir, max_buffered_rows=self._max_buffered_rows, flush_interval=self._flush_interval
+        )
         return self._experiment
 
     @rank_zero_only
@@ -169,14 +179,25 @@ class _ExperimentWriter:
     r"""
     Experiment writer for CSVLogger.
 
+    Only the rows that were not saved yet are kept in memory, :meth:`save` appends them to the metrics file. The file
+    is only rewritten when new metric keys show up, to extend its header.
+
     Args:
         log_dir: Directory for the experiment logs
+        max_buffered_rows: Save the recorded metrics once this many rows are waiting to be written.
+        flush_interval: Save the recorded metrics when this many seconds have passed since the last save.
+            Disabled by default.
     """
 
     NAME_METRICS_FILE = "metrics.csv"
 
-    def __init__(self, log_dir: str) -> None:
+    def __init__(self, log_dir: str, max_buffered_rows: int = 1000, flush_interval: Optional[float] = None) -> None:
         self.metrics: List[Dict[str, float]] = []
+        self.metrics_keys: List[str] = []
+        self.max_buffered_rows = max_buffered_rows
+        self.flush_interval = flush_interval
+        self._num_rows = 0
+        self._last_save_time = time.monotonic()
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -197,23 +218,59 @@ class _ExperimentWriter:
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_rows
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics["step"] = step
         self.metrics.append(metrics)
+        self._num_rows += 1
+
+        if len(self.metrics) >= self.max_buffered_rows or (
+            self.flush_interval is not None and time.monotonic() - self._last_save_time >= self.flush_interval
+        ):
+            self.save()
 
     def save(self) -> None:
         """Save recorded metrics into files."""
+        self._last_save_time = time.monotonic()
         if not self.metrics:
             return
 
-        last_m = {}
+        new_keys = self._new_keys()
+        if not self.metrics_keys:
+            # the first save of this experiment replaces the file of a previous run
+            self.metrics_keys = new_keys
+            self._write(self.metrics, mode="w")
+        elif new_keys:
+            self._rewrite_with_keys(self.metrics_keys + new_keys)
+            self._write(self.metrics, mode="a")
+        else:
+            self._write(self.metrics, mode="a")
+        self.metrics = []
+
+    def _new_keys(self) -> List[str]:
+        known_keys = set(self.metrics_keys)
+        new_keys = {}
         for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
-
-        with open(self.metrics_file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=metrics_keys)
+            for key in m:
+                if key not in known_keys:
+                    new_keys[key] = None
+        return list(new_keys)
+
+    def _write(self, rows: List[Dict[str, Any]], mode: str) -> None:
+        with open(self.metrics_file_path, mode, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+            if mode == "w":
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def _rewrite_with_keys(self, metrics_keys: List[str]) -> None:
+        """Streams the saved rows into a new file with the extended header and replaces the metrics file with it."""
+        tmp_path = self.metrics_file_path + ".tmp"
+        with open(self.metrics_file_path, newline="") as src, open(tmp_path, "w", newline="") as dst:
+            reader = csv.DictReader(src)
+            writer = csv.DictWriter(dst, fieldnames=metrics_keys)
             writer.writeheader()
-            writer.writerows(self.metrics)
+            writer.writerows(reader)
+        os.replace(tmp_path, self.metrics_file_path)
+        self.metrics_keys = metrics_keys
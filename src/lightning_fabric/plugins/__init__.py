@@ -13,6 +13,8 @@
 # limitations under the License.
 from lightning_fabric.plugins.environments.cluster_environment import ClusterEnvironment
 from lightning_fabric.plugins.io.checkpoint_io import CheckpointIO
+from lightning_fabric.plugins.io.incremental_io import IncrementalCheckpointIO
+from lightning_fabric.plugins.io.mmap_io import MmapCheckpointIO
 from lightning_fabric.plugins.io.torch_io import TorchCheckpointIO
 from lightning_fabric.plugins.io.xla import XLACheckpointIO
 from lightning_fabric.plugins.precision.deepspeed import DeepSpeedPrecision
@@ -26,6 +28,8 @@ from lightning_fabric.plugins.precision.tpu_bf16 import TPUBf16Precision
 __all__ = [
     "ClusterEnvironment",
     "CheckpointIO",
+    "IncrementalCheckpointIO",
+    "MmapCheckpointIO",
     "TorchCheckpointIO",
     "XLACheckpointIO",
     "Precision",
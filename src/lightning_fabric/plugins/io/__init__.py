@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from lightning_fabric.plugins.io.checkpoint_io import CheckpointIO
+from lightning_fabric.plugins.io.incremental_io import IncrementalCheckpointIO
+from lightning_fabric.plugins.io.mmap_io import MmapCheckpointIO
 from lightning_fabric.plugins.io.torch_io import TorchCheckpointIO
 from lightning_fabric.plugins.io.xla import XLACheckpointIO
 
-__all__ = ["CheckpointIO", "TorchCheckpointIO", "XLACheckpointIO"]
+__all__ = ["CheckpointIO", "IncrementalCheckpointIO", "MmapCheckpointIO", "TorchCheckpointIO", "XLACheckpointIO"]
@@ -0,0 +1,130 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
+from torch import Tensor
+
+from lightning_fabric.plugins.io.mmap_io import _as_bytes, _index_entry, _INDEX_FILE, MmapCheckpointIO
+from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.utilities.types import _PATH
+
+log = logging.getLogger(__name__)
+
+# name of the content-addressed tensor store, shared by all checkpoints saved in the same directory
+_STORE_DIRNAME = ".tensors"
+
+
+class IncrementalCheckpointIO(MmapCheckpointIO):
+    """CheckpointIO that only writes the tensors that changed since the previous checkpoints.
+
+    Checkpoints are saved in the format of :class:`~lightning_fabric.plugins.io.mmap_io.MmapCheckpointIO`, except
+    that every tensor is stored once in a content-addressed store (a ``.tensors`` directory next to the checkpoints)
+    under the hash of its bytes. A checkpoint only consists of its index and metadata, which reference the tensors
+    in the store, so tensors that did not change, e.g. the weights of a frozen backbone, are shared by all the
+    checkpoints instead of being written again. Tensors that no checkpoint references anymore are deleted from the
+    store when a checkpoint gets removed or overwritten.
+
+    Every tensor is hashed on every save: in-place writes through ``.data`` or by collectives don't bump the version
+    counter of the tensors, so there is no cheaper way to know that a tensor is unchanged.
+
+    Loading reconstructs the full checkpoint and also works with
+    :class:`~lightning_fabric.plugins.io.mmap_io.MmapCheckpointIO`.
+
+    .. warning::
+
+        This is currently an experimental plugin/feature and API changes are to be expected.
+    """
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Save the checkpoint, writing only the tensors that are not in the store yet.
+
+        The tensors of a checkpoint that got overwritten and that are not referenced by any other checkpoint are
+        deleted from the store.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target directory
+            storage_options: not used in ``IncrementalCheckpointIO.save_checkpoint``
+        """
+        fs = get_filesystem(path)
+        overwrite = fs.exists(str(path))
+        super().save_checkpoint(checkpoint, path, storage_options=storage_options)
+        if overwrite:
+            _collect_garbage(fs, os.path.dirname(str(path)))
+
+    def _write_tensors(
+        self, fs: AbstractFileSystem, path: str, tensors: List[Tuple[str, Tensor]], save_id: str
+    ) -> Dict[str, Any]:
+        """Writes the tensors that are not in the store yet and returns index entries that point into the store."""
+        store = os.path.join(os.path.dirname(path), _STORE_DIRNAME)
+        fs.makedirs(store, exist_ok=True)
+        entries = {}
+        written = 0
+        for key, tensor in tensors:
+            data = _as_bytes(tensor)
+            digest = hashlib.sha256(data).hexdigest()
+            blob = os.path.join(store, f"{digest}.bin")
+            if not fs.exists(blob):
+                _write_blob(fs, blob, data)
+                written += 1
+            entries[key] = _index_entry(tensor, f"../{_STORE_DIRNAME}/{digest}.bin", 0)
+        log.debug(f"Wrote {written}/{len(tensors)} tensors of checkpoint {path}")
+        return entries
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Remove the checkpoint and the tensors in the store that are not referenced by any other checkpoint.
+
+        Args:
+            path: Path to checkpoint
+        """
+        super().remove_checkpoint(path)
+        _collect_garbage(get_filesystem(path), os.path.dirname(str(path)))
+
+
+def _collect_garbage(fs: AbstractFileSystem, parent: str) -> None:
+    """Deletes the tensors in the store that are not referenced by any checkpoint in the directory."""
+    store = os.path.join(parent, _STORE_DIRNAME)
+    if not fs.exists(store):
+        return
+
+    referenced = set()
+    for index_path in fs.glob(os.path.join(parent, "*", _INDEX_FILE)):
+        with fs.open(index_path, "r") as f:
+            index = json.load(f)
+        referenced.update(
+            os.path.basename(entry["shard"])
+            for entry in index["tensors"].values()
+            if entry["shard"].startswith(f"../{_STORE_DIRNAME}/")
+        )
+    for blob in fs.ls(store, detail=False):
+        if os.path.basename(blob) not in referenced:
+            fs.rm(blob)
+
+
+def _write_blob(fs: AbstractFileSystem, path: str, data: Any) -> None:
+    if not isinstance(fs, LocalFileSystem):
+        # object stores only commit the upload once the file is closed
+        with fs.open(path, "wb") as f:
+            f.write(data)
+        return
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
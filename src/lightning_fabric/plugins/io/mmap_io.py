@@ -0,0 +1,273 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import mmap
+import os
+import uuid
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+import torch
+from fsspec.core import url_to_fs
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
+from lightning_utilities.core.apply_func import apply_to_collection
+from torch import Tensor
+
+from lightning_fabric.plugins.io.checkpoint_io import CheckpointIO
+from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
+
+log = logging.getLogger(__name__)
+
+_INDEX_FILE = "index.json"
+# metadata file of the checkpoints saved before the files were named after their save
+_METADATA_FILE = "metadata.pt"
+_FORMAT_VERSION = 1
+# tensors are aligned in the shards so that they can be viewed in-place from the memory map
+_ALIGNMENT = 64
+
+
+class _TensorRef:
+    """Placeholder that takes the place of a tensor in the metadata of a memory-mapped checkpoint."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+
+class MmapCheckpointIO(CheckpointIO):
+    """CheckpointIO that stores the tensors of a checkpoint in flat binary shard files next to a JSON index, which
+    allows loading them lazily through memory maps.
+
+    The checkpoint path is a directory that contains:
+
+    - ``index.json``: for each tensor, the shard it lives in, its byte offset, dtype, shape and original device
+    - ``shard-<id>-<n>.bin``: the raw tensor bytes, at most ``max_shard_size`` bytes per shard unless a single tensor
+      is larger than that
+    - ``metadata-<id>.pt``: everything that is not a tensor, saved with :func:`torch.save`
+
+    Every save writes its files under a new ``<id>`` and replaces ``index.json`` last, so overwriting a checkpoint
+    never leaves it incomplete: until the new index is in place, the previous index and the files it points to are
+    untouched. The files of the previous save are deleted afterwards.
+
+    When loading from a local filesystem, the returned tensors are views into copy-on-write memory maps of the
+    shards. Their data is only read from disk once accessed, e.g. when it gets copied into the module parameters
+    by ``load_state_dict``, so that the whole checkpoint never needs to be materialized in memory.
+
+    .. warning::
+
+        This is currently an experimental plugin/feature and API changes are to be expected.
+
+    Args:
+        max_shard_size: The maximum size of a shard file in bytes.
+    """
+
+    def __init__(self, max_shard_size: int = 2**30) -> None:
+        if max_shard_size < 1:
+            raise ValueError(f"`max_shard_size` must be a positive integer, got {max_shard_size}.")
+        self.max_shard_size = max_shard_size
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Save model/training states as a directory of tensor shards, an index and the remaining metadata.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target directory
+            storage_options: not used in ``MmapCheckpointIO.save_checkpoint``
+
+        Raises:
+            TypeError:
+                If ``storage_options`` arg is passed in
+        """
+        if storage_options is not None:
+            raise TypeError(
+                "`Trainer.save_checkpoint(..., storage_options=...)` with `storage_options` arg"
+                f" is not supported for `{self.__class__.__name__}`. Please implement your custom `CheckpointIO`"
+                " to define how you'd like to use `storage_options`."
+            )
+        fs = get_filesystem(path)
+        path = str(path)
+        if fs.isfile(path):
+            fs.rm(path)
+        fs.makedirs(path, exist_ok=True)
+        save_id = uuid.uuid4().hex[:12]
+
+        tensors: List[Tuple[str, Tensor]] = []
+
+        def _extract(tensor: Tensor) -> _TensorRef:
+            key = f"t{len(tensors)}"
+            tensors.append((key, tensor))
+            return _TensorRef(key)
+
+        metadata = apply_to_collection(checkpoint, Tensor, _extract)
+
+        metadata_file = f"metadata-{save_id}.pt"
+        index = {
+            "format_version": _FORMAT_VERSION,
+            "metadata": metadata_file,
+            "tensors": self._write_tensors(fs, path, tensors, save_id),
+        }
+
+        with fs.open(os.path.join(path, metadata_file), "wb") as f:
+            torch.save(metadata, f)
+        # the index is replaced last so that its presence marks a complete checkpoint
+        _replace_index(fs, path, index)
+
+        # the files of the previous checkpoint are no longer referenced
+        referenced = {_INDEX_FILE, metadata_file, *(entry["shard"] for entry in index["tensors"].values())}
+        for file in fs.ls(path, detail=False):
+            if os.path.basename(file) not in referenced:
+                fs.rm(file, recursive=True)
+
+    def _write_tensors(
+        self, fs: AbstractFileSystem, path: str, tensors: List[Tuple[str, Tensor]], save_id: str
+    ) -> Dict[str, Any]:
+        """Writes the tensors into the shard files and returns their index entries."""
+        entries = {}
+        shard_id, offset = -1, self.max_shard_size
+        shard_file: Optional[IO[bytes]] = None
+        try:
+            for key, tensor in tensors:
+                data = _as_bytes(tensor)
+                if shard_file is None or offset > 0 and offset + data.nbytes > self.max_shard_size:
+                    if shard_file is not None:
+                        shard_file.close()
+                    shard_id, offset = shard_id + 1, 0
+                    shard_file = fs.open(os.path.join(path, _shard_name(save_id, shard_id)), "wb")
+                padding = -offset % _ALIGNMENT
+                shard_file.write(b"\0" * padding)
+                offset += padding
+                shard_file.write(data)
+                entries[key] = _index_entry(tensor, _shard_name(save_id, shard_id), offset)
+                offset += data.nbytes
+        finally:
+            if shard_file is not None:
+                shard_file.close()
+        return entries
+
+    def load_checkpoint(self, path: _PATH, map_location: _MAP_LOCATION_TYPE = None) -> Dict[str, Any]:
+        """Loads the metadata of the checkpoint and lazily maps the tensors from the shards.
+
+        Args:
+            path: Path to the checkpoint directory
+            map_location: a :class:`torch.device`, string or a dict specifying how to remap the devices the tensors
+                were saved from. With ``None``, tensors are restored on their original device. A function can't be
+                applied lazily, tensors are kept on the CPU in that case.
+
+        Returns: The loaded checkpoint.
+
+        Raises:
+            FileNotFoundError: If ``path`` is not a checkpoint saved by this plugin
+        """
+        if not _is_mmap_checkpoint(path):
+            raise FileNotFoundError(f"Checkpoint at {path} not found. Aborting training.")
+        fs, root = url_to_fs(str(path))
+        with fs.open(os.path.join(root, _INDEX_FILE), "r") as f:
+            index = json.load(f)
+        with fs.open(os.path.join(root, index.get("metadata", _METADATA_FILE)), "rb") as f:
+            metadata = torch.load(f)
+
+        buffers: Dict[str, Any] = {}
+
+        def _materialize(ref: _TensorRef) -> Tensor:
+            entry = index["tensors"][ref.key]
+            dtype = getattr(torch, entry["dtype"])
+            shape = torch.Size(entry["shape"])
+            if shape.numel() == 0:
+                tensor = torch.empty(shape, dtype=dtype)
+            else:
+                if entry["shard"] not in buffers:
+                    buffers[entry["shard"]] = _open_shard(fs, os.path.normpath(os.path.join(root, entry["shard"])))
+                buffer = buffers[entry["shard"]]
+                tensor = torch.frombuffer(buffer, dtype=dtype, count=shape.numel(), offset=entry["offset"])
+                tensor = tensor.view(shape)
+            device = _map_device(entry["device"], map_location)
+            return tensor if device == "cpu" else tensor.to(device)
+
+        return apply_to_collection(metadata, _TensorRef, _materialize)
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Remove checkpoint directory from the filesystem.
+
+        Args:
+            path: Path to checkpoint
+        """
+        fs = get_filesystem(path)
+        path = str(path)
+        if fs.exists(path):
+            fs.rm(path, recursive=True)
+            log.debug(f"Removed checkpoint: {path}")
+
+
+def _is_mmap_checkpoint(path: Any) -> bool:
+    """Checks whether the given path points to a checkpoint saved by :class:`MmapCheckpointIO`."""
+    if not isinstance(path, (str, os.PathLike)) or str(path).startswith("http"):
+        return False
+    fs = get_filesystem(path)
+    return fs.isfile(os.path.join(str(path), _INDEX_FILE))
+
+
+def _shard_name(save_id: str, shard_id: int) -> str:
+    return f"shard-{save_id}-{shard_id:05d}.bin"
+
+
+def _replace_index(fs: AbstractFileSystem, path: str, index: Dict[str, Any]) -> None:
+    index_path = os.path.join(path, _INDEX_FILE)
+    if not isinstance(fs, LocalFileSystem):
+        # object stores only commit the upload once the file is closed
+        with fs.open(index_path, "w") as f:
+            json.dump(index, f)
+        return
+    tmp_path = f"{index_path}.tmp-{uuid.uuid4().hex}"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _index_entry(tensor: Tensor, shard: str, offset: int) -> Dict[str, Any]:
+    return {
+        "shard": shard,
+        "offset": offset,
+        "dtype": str(tensor.dtype).replace("torch.", ""),
+        "shape": list(tensor.shape),
+        "device": str(tensor.device),
+    }
+
+
+def _as_bytes(tensor: Tensor) -> Any:
+    tensor = tensor.detach().cpu().contiguous()
+    # 0-dim tensors can't be viewed as a different dtype
+    return tensor.reshape(-1).view(torch.uint8).numpy()
+
+
+def _open_shard(fs: AbstractFileSystem, path: str) -> Any:
+    if isinstance(fs, LocalFileSystem):
+        with open(path, "rb") as f:
+            # copy-on-write: writes to the loaded tensors never reach the file
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    return bytearray(fs.cat_file(path))
+
+
+def _map_device(device: str, map_location: _MAP_LOCATION_TYPE) -> str:
+    if map_location is None:
+        return device
+    if isinstance(map_location, (str, torch.device)):
+        return str(map_location)
+    if isinstance(map_location, dict):
+        return str(map_location.get(device, device))
+    return "cpu"
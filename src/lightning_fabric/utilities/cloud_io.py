@@ -13,14 +13,16 @@
 # limitations under the License.
 """Utilities related to data saving/loading."""
 
+import hashlib
 import io
+import os
+import uuid
 from pathlib import Path
-from typing import Any, Dict, IO, Union
+from typing import Any, Dict, IO, Optional, Union
 
-import fsspec
 import torch
 from fsspec.core import url_to_fs
-from fsspec.implementations.local import AbstractFileSystem
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
 
 from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
 
@@ -53,17 +55,66 @@ def get_filesystem(path: _PATH, **kwargs: Any) -> AbstractFileSystem:
     return fs
 
 
-def _atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
+def _atomic_save(
+    checkpoint: Dict[str, Any], filepath: Union[str, Path], hash_algorithm: Optional[str] = None
+) -> Optional[str]:
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    On the local filesystem, the checkpoint is streamed into a temporary file next to ``filepath`` which is then
+    renamed to ``filepath``, so the serialized checkpoint is never held in memory as a whole. Other filesystems, like
+    object stores, don't have an atomic rename (moving is a copy followed by a delete), so the checkpoint is streamed
+    to ``filepath`` directly. Object stores only commit the upload once the file is closed.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
             accepts.
         filepath: The path to which the checkpoint will be saved.
             This points to the file that the checkpoint will be stored in.
+        hash_algorithm: The name of a :mod:`hashlib` algorithm, e.g. ``"sha256"``. If set, the written bytes are
+            hashed chunk by chunk while being streamed to the file.
+
+    Returns:
+        The hex digest of the written file if ``hash_algorithm`` is set, otherwise ``None``.
     """
-    bytesbuffer = io.BytesIO()
-    torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+    fs, path = url_to_fs(str(filepath))
+    if not isinstance(fs, LocalFileSystem):
+        with fs.open(path, "wb") as f:
+            writer = _HashingWriter(f, hash_algorithm) if hash_algorithm is not None else f
+            torch.save(checkpoint, writer)
+        return writer.hexdigest() if isinstance(writer, _HashingWriter) else None
+
+    tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+    try:
+        with fs.open(tmp_path, "wb") as f:
+            writer = _HashingWriter(f, hash_algorithm) if hash_algorithm is not None else f
+            torch.save(checkpoint, writer)
+        # `os.replace` is atomic on POSIX and also overwrites on Windows
+        os.replace(tmp_path, path)
+    except BaseException:
+        if fs.exists(tmp_path):
+            fs.rm(tmp_path)
+        raise
+    return writer.hexdigest() if isinstance(writer, _HashingWriter) else None
+
+
+class _HashingWriter(io.RawIOBase):
+    """Wraps a writable binary file and hashes everything written to it."""
+
+    def __init__(self, file: IO[bytes], hash_algorithm: str) -> None:
+        super().__init__()
+        self._file = file
+        self._hash = hashlib.new(hash_algorithm)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
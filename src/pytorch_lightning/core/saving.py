@@ -29,6 +29,7 @@ from lightning_utilities.core.apply_func import apply_to_collection
 from typing_extensions import Self
 
 import pytorch_lightning as pl
+from lightning_fabric.plugins.io.mmap_io import _is_mmap_checkpoint, MmapCheckpointIO
 from lightning_fabric.utilities.cloud_io import _load as pl_load
 from lightning_fabric.utilities.cloud_io import get_filesystem
 from lightning_fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
@@ -157,7 +158,11 @@ def _load_from_checkpoint(
     if map_location is None:
         map_location = cast(_MAP_LOCATION_TYPE, lambda storage, loc: storage)
     with pl_legacy_patch():
-        checkpoint = pl_load(checkpoint_path, map_location=map_location)
+        if _is_mmap_checkpoint(checkpoint_path):
+            # the tensors stay memory-mapped and are streamed into the parameters by `load_state_dict`
+            checkpoint = MmapCheckpointIO().load_checkpoint(checkpoint_path, map_location=map_location)
+        else:
+            checkpoint = pl_load(checkpoint_path, map_location=map_location)
 
     # convert legacy checkpoints to the new format
     checkpoint = _pl_migrate_checkpoint(
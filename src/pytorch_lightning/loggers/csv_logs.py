@@ -44,12 +44,15 @@ class ExperimentWriter(_FabricExperimentWriter):
 
     Args:
         log_dir: Directory for the experiment logs
+        max_buffered_rows: Save the recorded metrics once this many rows are waiting to be written.
+        flush_interval: Save the recorded metrics when this many seconds have passed since the last save.
+            Disabled by default.
     """
 
     NAME_HPARAMS_FILE = "hparams.yaml"
 
-    def __init__(self, log_dir: str) -> None:
-        super().__init__(log_dir=log_dir)
+    def __init__(self, log_dir: str, max_buffered_rows: int = 1000, flush_interval: Optional[float] = None) -> None:
+        super().__init__(log_dir=log_dir, max_buffered_rows=max_buffered_rows, flush_interval=flush_interval)
         self.hparams: Dict[str, Any] = {}
 
     def log_hparams(self, params: Dict[str, Any]) -> None:
@@ -82,6 +85,9 @@ class CSVLogger(Logger, FabricCSVLogger):
             directory for existing versions, then automatically assigns the next available version.
         prefix: A string to put at the beginning of metric keys.
         flush_logs_every_n_steps: How often to flush logs to disk (defaults to every 100 steps).
+        max_buffered_rows: Also flush the logs to disk once this many rows are waiting to be written.
+        flush_interval: Also flush the logs to disk when this many seconds have passed since the last flush.
+            Disabled by default.
     """
 
     LOGGER_JOIN_CHAR = "-"
@@ -93,6 +99,8 @@ class CSVLogger(Logger, FabricCSVLogger):
         version: Optional[Union[int, str]] = None,
         prefix: str = "",
         flush_logs_every_n_steps: int = 100,
+        max_buffered_rows: int = 1000,
+        flush_interval: Optional[float] = None,
     ):
         super().__init__(
             root_dir=save_dir,
@@ -100,6 +108,8 @@ class CSVLogger(Logger, FabricCSVLogger):
             version=version,
             prefix=prefix,
             flush_logs_every_n_steps=flush_logs_every_n_steps,
+            max_buffered_rows=max_buffered_rows,
+            flush_interval=flush_interval,
         )
         self._save_dir = os.fspath(save_dir)
 
@@ -155,5 +165,7 @@ class CSVLogger(Logger, FabricCSVLogger):
             return self._experiment
 
         os.makedirs(self.root_dir, exist_ok=True)
-        self._experiment = ExperimentWriter(log_dir=self.log_dir)
+        self._experiment = ExperimentWriter(
+            log_dir=self.log_dir, max_buffered_rows=self._max_buffered_rows, flush_interval=self._flush_interval
+        )
         return self._experiment
@@ -106,10 +106,8 @@ class TrainingBatchLoop(Loop[_OUTPUTS_TYPE]):
         self.optimizer_loop.teardown()
         self.manual_loop.teardown()
         # release memory
-        if self.accumulated_loss.memory is not None:
-            self.accumulated_loss.memory = self.accumulated_loss.memory.cpu()
-        if self.running_loss.memory is not None:
-            self.running_loss.memory = self.running_loss.memory.cpu()
+        self.accumulated_loss.to("cpu")
+        self.running_loss.to("cpu")
 
     def _tbptt_split_batch(self, batch: Any) -> List[Any]:
         """Splits a single batch into a list of sequence steps for tbptt.
@@ -1,6 +1,13 @@
 from typing import Union
 
-from lightning_fabric.plugins import CheckpointIO, ClusterEnvironment, TorchCheckpointIO, XLACheckpointIO
+from lightning_fabric.plugins import (
+    CheckpointIO,
+    ClusterEnvironment,
+    IncrementalCheckpointIO,
+    MmapCheckpointIO,
+    TorchCheckpointIO,
+    XLACheckpointIO,
+)
 from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.hpu_plugin import HPUCheckpointIO
 from pytorch_lightning.plugins.layer_sync import LayerSync, NativeSyncBatchNorm
@@ -24,6 +31,8 @@ PLUGIN_INPUT = Union[PLUGIN, str]
 __all__ = [
     "AsyncCheckpointIO",
     "CheckpointIO",
+    "IncrementalCheckpointIO",
+    "MmapCheckpointIO",
     "TorchCheckpointIO",
     "XLACheckpointIO",
     "HPUCheckpointIO",
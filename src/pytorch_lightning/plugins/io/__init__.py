@@ -11,8 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from lightning_fabric.plugins import CheckpointIO, TorchCheckpointIO, XLACheckpointIO
+from lightning_fabric.plugins import (
+    CheckpointIO,
+    IncrementalCheckpointIO,
+    MmapCheckpointIO,
+    TorchCheckpointIO,
+    XLACheckpointIO,
+)
 from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.hpu_plugin import HPUCheckpointIO
 
-__all__ = ["AsyncCheckpointIO", "CheckpointIO", "HPUCheckpointIO", "TorchCheckpointIO", "XLACheckpointIO"]
+__all__ = [
+    "AsyncCheckpointIO",
+    "CheckpointIO",
+    "HPUCheckpointIO",
+    "IncrementalCheckpointIO",
+    "MmapCheckpointIO",
+    "TorchCheckpointIO",
+    "XLACheckpointIO",
+]
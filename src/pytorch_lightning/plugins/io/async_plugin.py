@@ -12,51 +12,188 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import torch
+from lightning_utilities.core.apply_func import apply_to_collection
+from torch import Tensor
 
 from lightning_fabric.plugins import CheckpointIO
+from lightning_fabric.utilities.types import _PATH
 from pytorch_lightning.plugins.io.wrapper import _WrappingCheckpointIO
 
 
 class AsyncCheckpointIO(_WrappingCheckpointIO):
     """``AsyncCheckpointIO`` enables saving the checkpoints asynchronously in a thread.
 
+    Before a save is handed over to the background thread, all tensors in the checkpoint are copied into CPU buffers
+    (pinned when CUDA is available) so that the training loop can keep updating the weights in-place while the
+    checkpoint is being written. The buffers are reused across saves.
+
     .. warning::
 
         This is currently an experimental plugin/feature and API changes are to be expected.
 
     Args:
         checkpoint_io: A checkpoint IO plugin that is used as the basis for async checkpointing.
+        max_pending: The maximum number of checkpoints that can be in-flight at the same time. Each slot keeps its
+            own set of host buffers. When all slots are busy, ``save_checkpoint`` blocks until the oldest save
+            has completed.
     """
 
-    def __init__(self, checkpoint_io: Optional["CheckpointIO"] = None) -> None:
+    def __init__(self, checkpoint_io: Optional["CheckpointIO"] = None, max_pending: int = 1) -> None:
         super().__init__(checkpoint_io)
+        if max_pending < 1:
+            raise ValueError(f"`max_pending` must be a positive integer, got {max_pending}.")
 
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[Tuple[Future, int]] = deque()
+        self._free_slots = list(range(max_pending))
+        self._buffers: Dict[int, List[Tensor]] = {slot: [] for slot in range(max_pending)}
         self._error: Optional[BaseException] = None
+        self._num_saves = 0
+        # index of the first save submitted after the last queued removal
+        self._removal_horizon = 0
+        # index of the last save that failed, not reset when the error is raised
+        self._last_failed_save = -1
 
-    def save_checkpoint(self, *args: Any, **kwargs: Any) -> None:
-        """Uses the ``ThreadPoolExecutor`` to save the checkpoints using the base ``checkpoint_io``."""
+    def save_checkpoint(self, checkpoint: Dict[str, Any], *args: Any, **kwargs: Any) -> None:
+        """Snapshots the checkpoint into host buffers and uses the ``ThreadPoolExecutor`` to save it using the base
+        ``checkpoint_io``."""
+        # if an error was raised between the previous time `save_checkpoint`` was called and now,
+        # because `executor.submit` is not blocking
+        self._raise_if_failed()
+
+        if not self._free_slots:
+            # backpressure: wait for the oldest save to release its buffers
+            self._wait_for_oldest()
+            self._raise_if_failed()
+
+        slot = self._free_slots.pop()
+        checkpoint, event = self._snapshot(checkpoint, slot)
+        index = self._num_saves
+        self._num_saves += 1
 
         def _save_checkpoint(*args: Any, **kwargs: Any) -> None:
             try:
+                if event is not None:
+                    event.synchronize()
                 assert self.checkpoint_io is not None
                 self.checkpoint_io.save_checkpoint(*args, **kwargs)
             except BaseException as e:
+                self._last_failed_save = max(self._last_failed_save, index)
                 self._error = e
 
-        self._executor.submit(_save_checkpoint, *args, **kwargs)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        future = self._executor.submit(_save_checkpoint, checkpoint, *args, **kwargs)
+        self._pending.append((future, slot))
 
-        # if an error was raised between the previous time `save_checkpoint`` was called and now,
-        # because `executor.submit` is not blocking
-        if self._error:
-            raise self._error
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Removes the checkpoint with the base ``checkpoint_io`` once all the checkpoints saved before this call
+        have been written.
+
+        The removal is queued behind the pending saves so that superseded files are never deleted before their
+        replacement exists. If any of the saves submitted since the previous removal failed, the file is kept, even
+        if the error was already raised.
+        """
+        horizon = self._removal_horizon
+        self._removal_horizon = self._num_saves
+
+        def _remove_checkpoint(path: _PATH) -> None:
+            if self._last_failed_save >= horizon:
+                return
+            try:
+                assert self.checkpoint_io is not None
+                self.checkpoint_io.remove_checkpoint(path)
+            except BaseException as e:
+                self._error = e
+
+        if self._executor is None:
+            _remove_checkpoint(path)
+        else:
+            self._executor.submit(_remove_checkpoint, path)
+        self._raise_if_failed()
+
+    def load_checkpoint(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Waits for the pending saves and then uses the base ``checkpoint_io`` to load the checkpoint."""
+        self.wait_for_pending()
+        return super().load_checkpoint(*args, **kwargs)
+
+    def wait_for_pending(self) -> None:
+        """Blocks until all the checkpoints that were submitted for saving have been written.
+
+        Raises:
+            BaseException:
+                The error raised while saving any of the pending checkpoints.
+        """
+        while self._pending:
+            self._wait_for_oldest()
+        if self._executor is not None:
+            # flush the queued removals too
+            self._executor.submit(lambda: None).result()
+        self._raise_if_failed()
 
     def teardown(self) -> None:
         """This method is called to close the threads."""
-        self._executor.shutdown(wait=True)
+        try:
+            self.wait_for_pending()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _wait_for_oldest(self) -> None:
+        future, slot = self._pending.popleft()
+        future.result()
+        self._free_slots.append(slot)
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _snapshot(self, checkpoint: Dict[str, Any], slot: int) -> Tuple[Dict[str, Any], Optional[Any]]:
+        """Copies every tensor in the checkpoint into the host buffers of the given slot.
+
+        The buffers are matched to the tensors by their traversal order and are only re-allocated when the shape or
+        dtype change. Device-to-host copies are non-blocking, the returned CUDA event (if any) needs to
+        be synchronized before the buffers are read.
+        """
+        buffers = self._buffers[slot]
+        pin_memory = torch.cuda.is_available()
+        index = 0
+        has_device_tensors = False
+
+        def _copy(tensor: Tensor) -> Tensor:
+            nonlocal index, has_device_tensors
+            if tensor.layout != torch.strided or tensor.is_quantized:
+                # non-dense tensors are not buffered
+                return tensor.detach().to("cpu", copy=True)
+            if index == len(buffers):
+                buffers.append(_empty_buffer(tensor, pin_memory))
+            buffer = buffers[index]
+            if buffer.shape != tensor.shape or buffer.dtype != tensor.dtype:
+                buffer = buffers[index] = _empty_buffer(tensor, pin_memory)
+            index += 1
+            non_blocking = tensor.device.type == "cuda"
+            has_device_tensors |= non_blocking
+            buffer.copy_(tensor.detach(), non_blocking=non_blocking)
+            return buffer
+
+        snapshot = apply_to_collection(checkpoint, Tensor, _copy)
+        # drop the buffers of tensors that are no longer part of the checkpoint
+        del buffers[index:]
+
+        event = None
+        if has_device_tensors:
+            event = torch.cuda.Event()
+            event.record()
+        return snapshot, event
+
 
-        # if an error was raised anytime in any of the `executor.submit` calls
-        if self._error:
-            raise self._error
+def _empty_buffer(tensor: Tensor, pin_memory: bool) -> Tensor:
+    return torch.empty(tensor.shape, dtype=tensor.dtype, device="cpu", pin_memory=pin_memory)
@@ -13,11 +13,12 @@
 # limitations under the License.
 """Profiler to check if there are any bottlenecks in your code."""
 import logging
+import math
 import os
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -31,6 +32,79 @@ _TABLE_ROW = Tuple[str, float, float]
 _TABLE_DATA = List[_TABLE_ROW]
 
 
+class _DurationStats:
+    """Streaming aggregates over the durations of an action.
+
+    Keeps the count, sum, sum of squares, minimum and maximum of the durations together with a sketch of their
+    distribution. The sketch counts the durations in logarithmic buckets so that the quantiles are estimated within
+    ``relative_accuracy`` of the exact value, using at most ``max_buckets`` buckets. When there are more, the lowest
+    buckets are merged, which only degrades the accuracy of the lowest quantiles.
+    """
+
+    __slots__ = ("count", "total", "total_squared", "min", "max", "_gamma", "_log_gamma", "_max_buckets", "_buckets")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.total_squared = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        # bucket `i` counts the durations in `(gamma ** (i - 1), gamma ** i]`, durations of 0 go to `None`
+        self._buckets: Dict[Optional[int], int] = {}
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.total_squared += duration * duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        key = math.ceil(math.log(duration) / self._log_gamma) if duration > 0 else None
+        buckets = self._buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self._max_buckets:
+            self._collapse()
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return math.nan
+        return math.sqrt(max(self.total_squared / self.count - self.mean**2, 0.0))
+
+    def quantile(self, q: float) -> float:
+        """Estimates the ``q``-th quantile of the durations, with ``0 <= q <= 1``."""
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key, count in self._sorted_buckets():
+            seen += count
+            if seen > rank:
+                if key is None:
+                    return 0.0
+                # the value that minimizes the relative error for the bucket, clipped to the observed values
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def _sorted_buckets(self) -> Iterator[Tuple[Optional[int], int]]:
+        if None in self._buckets:
+            yield None, self._buckets[None]
+        yield from sorted((k, v) for k, v in self._buckets.items() if k is not None)
+
+    def _collapse(self) -> None:
+        lowest, second_lowest = sorted(k for k in self._buckets if k is not None)[:2]
+        self._buckets[second_lowest] += self._buckets.pop(lowest)
+
+
 class SimpleProfiler(Profiler):
     """This profiler simply records the duration of actions (in seconds) and reports the mean duration of each
     action and the total time spent over the entire training run."""
@@ -40,6 +114,8 @@ class SimpleProfiler(Profiler):
         dirpath: Optional[Union[str, Path]] = None,
         filename: Optional[str] = None,
         extended: bool = True,
+        streaming: bool = False,
+        snapshot_interval: Optional[float] = None,
     ) -> None:
         """
         Args:
@@ -53,42 +129,99 @@ class SimpleProfiler(Profiler):
             extended: If ``True``, adds extra columns representing number of calls and percentage of total time spent on
                 respective action.
 
+            streaming: If ``True``, only streaming aggregates of the durations of each action are kept in memory
+                instead of every duration: the count, sum, sum of squares, minimum, maximum and a fixed-size sketch
+                to estimate the quantiles. This keeps the memory usage and the cost of :meth:`summary` constant on
+                long runs.
+
+            snapshot_interval: Minimum number of seconds between two snapshots of the aggregates sent to the loggers
+                of the ``Trainer``. Requires ``streaming=True``. Disabled by default.
+
         Raises:
             ValueError:
                 If you attempt to start an action which has already started, or
-                if you attempt to stop recording an action which was never started.
+                if you attempt to stop recording an action which was never started, or
+                if ``snapshot_interval`` is set without ``streaming=True``.
         """
         super().__init__(dirpath=dirpath, filename=filename)
-        self.current_actions: Dict[str, float] = {}
-        self.recorded_durations: Dict = defaultdict(list)
+        if snapshot_interval is not None and not streaming:
+            raise ValueError("`SimpleProfiler(snapshot_interval=...)` requires `streaming=True`.")
+        self.current_actions: Dict[str, int] = {}
+        self.streaming = streaming
+        self.recorded_durations: Dict = defaultdict(_DurationStats if streaming else list)
         self.extended = extended
+        self.snapshot_interval = snapshot_interval
         self.start_time = time.monotonic()
+        self._last_snapshot_time = self.start_time
+        self._lightning_module: Optional[Any] = None  # set by the `Trainer`
 
     def start(self, action_name: str) -> None:
         if action_name in self.current_actions:
             raise ValueError(f"Attempted to start {action_name} which has already started.")
-        self.current_actions[action_name] = time.monotonic()
+        self.current_actions[action_name] = time.perf_counter_ns()
 
     def stop(self, action_name: str) -> None:
-        end_time = time.monotonic()
+        end_time = time.perf_counter_ns()
         if action_name not in self.current_actions:
             raise ValueError(f"Attempting to stop recording an action ({action_name}) which was never started.")
         start_time = self.current_actions.pop(action_name)
-        duration = end_time - start_time
-        self.recorded_durations[action_name].append(duration)
+        duration = (end_time - start_time) / 1e9
+        if self.streaming:
+            self.recorded_durations[action_name].add(duration)
+            if (
+                self.snapshot_interval is not None
+                and time.monotonic() - self._last_snapshot_time >= self.snapshot_interval
+            ):
+                self._log_snapshot()
+        else:
+            self.recorded_durations[action_name].append(duration)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Returns the current aggregates of the durations of each action, in seconds.
+
+        Requires ``streaming=True``.
+        """
+        if not self.streaming:
+            raise ValueError("`SimpleProfiler.snapshot()` requires `streaming=True`.")
+        metrics = {}
+        for action, stats in self.recorded_durations.items():
+            prefix = f"profiler/{action}"
+            metrics[f"{prefix}/count"] = float(stats.count)
+            metrics[f"{prefix}/total"] = stats.total
+            metrics[f"{prefix}/mean"] = stats.mean
+            metrics[f"{prefix}/std"] = stats.std
+            metrics[f"{prefix}/min"] = stats.min
+            metrics[f"{prefix}/max"] = stats.max
+            metrics[f"{prefix}/p50"] = stats.quantile(0.5)
+            metrics[f"{prefix}/p99"] = stats.quantile(0.99)
+        return metrics
+
+    def _log_snapshot(self) -> None:
+        self._last_snapshot_time = time.monotonic()
+        trainer = getattr(self._lightning_module, "_trainer", None) if self._lightning_module is not None else None
+        if trainer is None:
+            return
+        metrics = self.snapshot()
+        for logger in trainer.loggers:
+            logger.log_metrics(metrics, step=trainer.global_step)
+
+    def _action_totals(self) -> List[Tuple[str, float, int, float]]:
+        """Returns the mean duration, number of calls and total duration of each action."""
+        if self.streaming:
+            return [(a, d.mean, d.count, d.total) for a, d in self.recorded_durations.items()]
+        return [(a, np.mean(d), len(d), np.sum(d)) for a, d in self.recorded_durations.items()]
 
     def _make_report_extended(self) -> Tuple[_TABLE_DATA_EXTENDED, float, float]:
         total_duration = time.monotonic() - self.start_time
         report = [
-            (a, np.mean(d), len(d), np.sum(d), 100.0 * np.sum(d) / total_duration)
-            for a, d in self.recorded_durations.items()
+            (a, mean, count, total, 100.0 * total / total_duration) for a, mean, count, total in self._action_totals()
         ]
         report.sort(key=lambda x: x[4], reverse=True)
         total_calls = sum(x[2] for x in report)
         return report, total_calls, total_duration
 
     def _make_report(self) -> _TABLE_DATA:
-        report = [(action, np.mean(d), np.sum(d)) for action, d in self.recorded_durations.items()]
+        report = [(action, mean, total) for action, mean, _, total in self._action_totals()]
         report.sort(key=lambda x: x[1], reverse=True)
         return report
 
@@ -245,9 +245,15 @@ class _ResultMetric(Metric, _DeviceDtypeModuleMixin):
 
             # perform accumulation with reduction
             if self.meta.is_mean_reduction:
-                # do not use `+=` as it doesn't do type promotion
-                self.value = self.value + value * batch_size
-                self.cumulated_batch_size = self.cumulated_batch_size + batch_size
+                if isinstance(batch_size, int) and value.dtype == self.value.dtype:
+                    # performance: accumulate in-place with a single fused op. This is safe because these states are
+                    # never returned directly, `compute` always creates a new tensor for the mean
+                    self.value.add_(value, alpha=batch_size)
+                    self.cumulated_batch_size.add_(batch_size)
+                else:
+                    # do not use `+=` as it doesn't do type promotion
+                    self.value = self.value + value * batch_size
+                    self.cumulated_batch_size = self.cumulated_batch_size + batch_size
             elif self.meta.is_max_reduction or self.meta.is_min_reduction:
                 self.value = self.meta.reduce_fx(self.value, value)
             elif self.meta.is_sum_reduction:
@@ -401,6 +407,8 @@ class _ResultCollection(dict):
         self.batch: Optional[Any] = None
         self.batch_size: Optional[int] = None
         self.dataloader_idx: Optional[int] = None
+        # the arguments of the previous `log` call for each key. used to skip re-creating and comparing the metadata
+        self._log_args: Dict[str, Tuple] = {}
 
     @property
     def result_metrics(self) -> List[_ResultMetric]:
@@ -453,7 +461,8 @@ class _ResultCollection(dict):
         """See :meth:`~pytorch_lightning.core.module.LightningModule.log`"""
         # no metrics should be logged with graphs
         if not enable_graph:
-            value = recursive_detach(value)
+            # performance: skip the collection traversal for the common single tensor case
+            value = value.detach() if isinstance(value, Tensor) else recursive_detach(value)
 
         # move metrics to cpu on TPU.
         if isinstance(value, Tensor) and value.device.type == "xla":
@@ -466,6 +475,29 @@ class _ResultCollection(dict):
             key += f".{self.dataloader_idx}"
             fx += f".{self.dataloader_idx}"
 
+        log_args = (
+            name,
+            prog_bar,
+            logger,
+            on_step,
+            on_epoch,
+            reduce_fx,
+            enable_graph,
+            sync_dist,
+            sync_dist_fn,
+            sync_dist_group,
+            add_dataloader_idx,
+            self.dataloader_idx,
+            metric_attribute,
+            rank_zero_only,
+        )
+        if key in self and self._log_args.get(key) == log_args:
+            # performance: same call as before, the stored metadata matches
+            result_metric = self[key]
+            batch_size = self._extract_batch_size(result_metric, batch_size, result_metric.meta)
+            self.update_metrics(key, value, batch_size)
+            return
+
         meta = _Metadata(
             fx=fx,
             name=name,
@@ -490,6 +522,7 @@ class _ResultCollection(dict):
             raise MisconfigurationException(
                 f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
             )
+        self._log_args[key] = log_args
 
         batch_size = self._extract_batch_size(self[key], batch_size, meta)
         self.update_metrics(key, value, batch_size)
@@ -515,7 +548,12 @@ class _ResultCollection(dict):
             result_metric.forward(v.to(self.device), batch_size)
             result_metric.has_reset = False
 
-        apply_to_collections(self[key], value, _ResultMetric, fn)
+        result_metric = self[key]
+        if isinstance(result_metric, _ResultMetric):
+            # performance: skip the collection traversal for the common single value case
+            fn(result_metric, value)  # type: ignore[arg-type]
+        else:
+            apply_to_collections(result_metric, value, _ResultMetric, fn)
 
     @staticmethod
     def _get_cache(result_metric: _ResultMetric, on_step: bool) -> Optional[Tensor]:
@@ -574,9 +612,74 @@ class _ResultCollection(dict):
             forked_name += dataloader_suffix
         return name, forked_name
 
+    def _sync_epoch_metrics(self) -> None:
+        """Computes the epoch-level values of the tensor metrics logged with ``sync_dist=True``.
+
+        Instead of reducing each metric state with its own collective, the states that share the same reduction
+        function, operation, process group, dtype and device are flattened into a single bucket that gets reduced at
+        once. The computed values are cached on the metrics so that ``_get_cache`` does not sync them again.
+        """
+        buckets: Dict[Tuple, List[Tuple[_ResultMetric, str]]] = {}
+
+        def add_to_bucket(result_metric: _ResultMetric) -> None:
+            sync = result_metric.meta.sync
+            if (
+                not result_metric.is_tensor
+                or not result_metric.meta.on_epoch
+                or result_metric._computed is not None
+                or not sync.should
+                or sync.rank_zero_only
+                or sync.fn is None
+            ):
+                return
+            states = ["value", "cumulated_batch_size"] if result_metric.meta.is_mean_reduction else ["value"]
+            for state in states:
+                tensor = getattr(result_metric, state)
+                key = (sync.fn, sync.op, id(sync.group), tensor.dtype, tensor.device)
+                buckets.setdefault(key, []).append((result_metric, state))
+
+        for _, item in self.valid_items():
+            apply_to_collection(item, _ResultMetric, add_to_bucket)
+
+        synced: Dict[int, Dict[str, Tensor]] = {}
+        for bucket in buckets.values():
+            tensors = [getattr(result_metric, state) for result_metric, state in bucket]
+            flat = torch.cat([tensor.reshape(-1) for tensor in tensors])
+            reduced = bucket[0][0].meta.sync(flat)
+            if not isinstance(reduced, Tensor) or reduced.shape != flat.shape:
+                # the strategy does not reduce element-wise, these metrics get synced one by one in `_get_cache`
+                continue
+            for (result_metric, state), tensor, chunk in zip(
+                bucket, tensors, reduced.split([tensor.numel() for tensor in tensors])
+            ):
+                synced.setdefault(id(result_metric), {})[state] = chunk.view(tensor.shape)
+
+        for bucket in buckets.values():
+            for result_metric, _ in bucket:
+                states = synced.get(id(result_metric), {})
+                if result_metric._computed is not None or "value" not in states:
+                    continue
+                if result_metric.meta.is_mean_reduction:
+                    if "cumulated_batch_size" not in states:
+                        continue
+                    computed = states["value"] / states["cumulated_batch_size"]
+                else:
+                    computed = states["value"]
+                if not result_metric._update_called:
+                    rank_zero_warn(
+                        f"The ``compute`` method of metric {result_metric.__class__.__name__}"
+                        " was called before the ``update`` method which may lead to errors,"
+                        " as metric states have not yet been updated.",
+                    )
+                result_metric._computed = computed
+
     def metrics(self, on_step: bool) -> _METRICS:
         metrics = _METRICS(callback={}, log={}, pbar={})
 
+        if not on_step:
+            # performance: reduce the synced metrics with as few collectives as possible
+            self._sync_epoch_metrics()
+
         for _, result_metric in self.valid_items():
 
             # extract forward_cache or computed from the _ResultMetric. ignore when the output is None
@@ -663,7 +766,7 @@ class _ResultCollection(dict):
         return f"{{{self.training}, {repr(self.device)}, {super().__repr__()}}}"
 
     def __getstate__(self, drop_value: bool = True) -> dict:
-        d = self.__dict__.copy()
+        d = {k: v for k, v in self.__dict__.items() if k != "_log_args"}
         # all the items should be either `_ResultMetric`s or `_ResultMetricCollection`s
         items = {k: v.__getstate__(drop_value=drop_value) for k, v in self.items()}
         return {**d, "items": items}
@@ -672,6 +775,8 @@ class _ResultCollection(dict):
         self, state: dict, map_location: Optional[Union[str, torch.device]] = None, sync_fn: Optional[Callable] = None
     ) -> None:
         self.__dict__.update({k: v for k, v in state.items() if k != "items"})
+        # the metadata of the reloaded items needs to be validated again
+        self._log_args = {}
 
         def setstate(k: str, item: dict) -> Union[_ResultMetric, _ResultMetricCollection]:
             if not isinstance(item, dict):
@@ -36,6 +36,10 @@ from pytorch_lightning.utilities.imports import _fault_tolerant_training
 class TensorRunningAccum:
     """Tracks a running accumulation values (min, max, mean) without graph references.
 
+    The mean is computed in constant time from a ring buffer of running sums, for the whole window or for any shorter
+    window passed as ``window``. The running sums are rebuilt from the stored values each time the buffer rotates so
+    that floating point errors do not accumulate.
+
     Examples:
         >>> accum = TensorRunningAccum(5)
         >>> accum.last(), accum.mean()
@@ -50,20 +54,28 @@ class TensorRunningAccum:
         >>> _= [accum.append(torch.tensor(i)) for i in range(13)]
         >>> accum.last(), accum.mean(), accum.min(), accum.max()
         (tensor(12.), tensor(10.), tensor(8.), tensor(12.))
+        >>> accum.mean(window=2), accum.min(window=2)
+        (tensor(11.5000), tensor(11.))
     """
 
     def __init__(self, window_length: int):
         self.window_length = window_length
+        self._memory_buffer: Optional[Tensor] = None
+        self._sums_buffer: Optional[Tensor] = None
         self.reset(window_length)
 
     def reset(self, window_length: Optional[int] = None) -> None:
         """Empty the accumulator."""
-        if window_length is not None:
+        if window_length is not None and window_length != self.window_length:
             self.window_length = window_length
+            self._memory_buffer = self._sums_buffer = None
         self.memory: Optional[Tensor] = None
         self.current_idx: int = 0
         self.last_idx: Optional[int] = None
         self.rotated: bool = False
+        # `self._sums[i]` holds the sum of all the values appended up to the one stored at `self._sums_idx`
+        self._sums: Optional[Tensor] = None
+        self._sums_idx: int = 0
 
     def last(self) -> Optional[Tensor]:
         """Get the last added element."""
@@ -74,13 +86,17 @@ class TensorRunningAccum:
     def append(self, x: Tensor) -> None:
         """Add an element to the accumulator."""
         if self.memory is None:
-            # tradeoff memory for speed by keeping the memory on device
-            self.memory = torch.zeros(self.window_length, *x.shape, device=x.device, dtype=x.dtype)
+            self._init_memory(x)
+        assert isinstance(self.memory, Tensor)
+        assert isinstance(self._sums, Tensor)
 
         # store without grads
         with torch.no_grad():
             self.memory[self.current_idx] = x
             self.last_idx = self.current_idx
+            previous_idx = self._sums_idx
+            self._sums_idx = (self._sums_idx + 1) % (self.window_length + 1)
+            torch.add(self._sums[previous_idx], self.memory[self.current_idx], out=self._sums[self._sums_idx])
 
         # increase index
         self.current_idx += 1
@@ -89,25 +105,85 @@ class TensorRunningAccum:
         self.current_idx = self.current_idx % self.window_length
         if self.current_idx == 0:
             self.rotated = True
+            self._rebuild_sums()
+
+    def to(self, device: Union[str, torch.device]) -> "TensorRunningAccum":
+        """Move the stored elements to the given device."""
+        for name in ("memory", "_sums", "_memory_buffer", "_sums_buffer"):
+            tensor = getattr(self, name)
+            if tensor is not None:
+                setattr(self, name, tensor.to(device))
+        return self
 
-    def mean(self) -> Optional[Tensor]:
-        """Get mean value from stored elements."""
-        return self._agg_memory("mean")
-
-    def max(self) -> Optional[Tensor]:
-        """Get maximal value from stored elements."""
-        return self._agg_memory("max")
-
-    def min(self) -> Optional[Tensor]:
-        """Get minimal value from stored elements."""
-        return self._agg_memory("min")
-
-    def _agg_memory(self, how: str) -> Optional[Tensor]:
-        if self.last_idx is not None:
-            assert isinstance(self.memory, Tensor)
-            if self.rotated:
-                return getattr(self.memory.float(), how)()
-            return getattr(self.memory[: self.current_idx].float(), how)()
+    def mean(self, window: Optional[int] = None) -> Optional[Tensor]:
+        """Get mean value from the last ``window`` stored elements, all of them by default."""
+        num_elements = self._num_elements(window)
+        if not num_elements:
+            return None
+        assert isinstance(self._sums, Tensor)
+        start_idx = (self._sums_idx - num_elements) % (self.window_length + 1)
+        mean = (self._sums[self._sums_idx] - self._sums[start_idx]) / num_elements
+        if not torch.isfinite(mean).all():
+            # a non-finite value, e.g. the loss of an fp16 overflow step, poisons all the following running sums
+            # until the next rotation even once it left the window
+            mean = self._window(num_elements).float().mean(dim=0)
+        return mean
+
+    def max(self, window: Optional[int] = None) -> Optional[Tensor]:
+        """Get maximal value from the last ``window`` stored elements, all of them by default."""
+        return self._agg_memory("max", window)
+
+    def min(self, window: Optional[int] = None) -> Optional[Tensor]:
+        """Get minimal value from the last ``window`` stored elements, all of them by default."""
+        return self._agg_memory("min", window)
+
+    def _num_elements(self, window: Optional[int]) -> int:
+        if self.last_idx is None:
+            return 0
+        num_elements = self.window_length if self.rotated else self.current_idx
+        if window is not None:
+            if window < 1:
+                raise ValueError(f"`window` must be a positive integer, got {window}.")
+            num_elements = min(window, num_elements)
+        return num_elements
+
+    def _init_memory(self, x: Tensor) -> None:
+        memory, sums = self._memory_buffer, self._sums_buffer
+        if memory is None or memory.shape[1:] != x.shape or memory.device != x.device or memory.dtype != x.dtype:
+            # tradeoff memory for speed by keeping the memory on device
+            memory = torch.zeros(self.window_length, *x.shape, device=x.device, dtype=x.dtype)
+            sums = torch.zeros(self.window_length + 1, *x.shape, device=x.device, dtype=torch.float)
+            self._memory_buffer, self._sums_buffer = memory, sums
+        assert isinstance(sums, Tensor)
+        # reuse the buffers released by `reset`, only the running sum before the first element needs to be cleared
+        sums[0] = 0
+        self.memory, self._sums = memory, sums
+
+    def _rebuild_sums(self) -> None:
+        # the memory is in chronological order right after rotating
+        assert isinstance(self.memory, Tensor)
+        assert isinstance(self._sums, Tensor)
+        with torch.no_grad():
+            self._sums[0] = 0
+            torch.cumsum(self.memory, dim=0, dtype=self._sums.dtype, out=self._sums[1:])
+        self._sums_idx = self.window_length
+
+    def _agg_memory(self, how: str, window: Optional[int] = None) -> Optional[Tensor]:
+        num_elements = self._num_elements(window)
+        if not num_elements:
+            return None
+        # reduce before casting to avoid copying the whole memory
+        return getattr(self._window(num_elements), how)().float()
+
+    def _window(self, num_elements: int) -> Tensor:
+        """Returns the last ``num_elements`` stored elements."""
+        assert isinstance(self.memory, Tensor)
+        if num_elements == self.window_length:
+            return self.memory
+        if self.current_idx >= num_elements:
+            return self.memory[self.current_idx - num_elements : self.current_idx]
+        # the window wraps around the end of the memory
+        return torch.cat([self.memory[self.current_idx - num_elements :], self.memory[: self.current_idx]])
 
 
 @dataclass
@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import sys
 import tempfile
 import time
@@ -12,8 +13,10 @@ import pytest
 
 from lightning_app import LightningApp, LightningFlow, LightningWork
 from lightning_app.components.database import Database, DatabaseClient
+from lightning_app.components.database.server import _apply_page_delta, _file_digest
 from lightning_app.components.database.utilities import _GeneralModel, _pydantic_column_type
 from lightning_app.runners import MultiProcessRuntime
+from lightning_app.storage import Drive
 from lightning_app.utilities.imports import _is_sqlmodel_available
 
 if _is_sqlmodel_available():
@@ -204,3 +207,65 @@ def test_work_database_periodic_store():
             MultiProcessRuntime(app).dispatch()
     except Exception:
         print(traceback.print_exc())
+
+
+def _insert_rows(db_filename, start, stop):
+    connection = sqlite3.connect(db_filename)
+    connection.execute("CREATE TABLE IF NOT EXISTS rows (id INTEGER PRIMARY KEY, value TEXT)")
+    connection.executemany("INSERT INTO rows VALUES (?, ?)", [(i, "x" * 100) for i in range(start, stop)])
+    connection.commit()
+    connection.close()
+
+
+def _count_rows(db_filename):
+    connection = sqlite3.connect(db_filename)
+    count = connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+    connection.close()
+    return count
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_work_database_incremental_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.chdir(tmp_path)
+
+    db = Database(models=[TestConfig], db_filename="test.db", incremental_store=True, compaction_interval=2)
+    db._name = "root.db"
+    drive = Drive("lit://database", component_name=db.name)
+
+    _insert_rows("test.db", 0, 1000)
+    connection = sqlite3.connect("test.db")
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.close()
+    db.store_database()
+    assert drive.list(component_name=db.name) == ["test.db"]
+    snapshot_size = os.path.getsize(tmp_path / "storage" / "artifacts" / "drive" / "database" / "root.db" / "test.db")
+
+    _insert_rows("test.db", 1000, 1010)
+    db.store_database()
+    _insert_rows("test.db", 1010, 1020)
+    db.store_database()
+    # nothing changed, nothing is stored
+    db.store_database()
+    assert sorted(drive.list(component_name=db.name)) == ["test.db", "test.db.000001.delta", "test.db.000002.delta"]
+    delta_path = tmp_path / "storage" / "artifacts" / "drive" / "database" / "root.db" / "test.db.000001.delta"
+    assert os.path.getsize(delta_path) < snapshot_size / 4
+    stale_delta_path = tmp_path / "stale.delta"
+    stale_delta_path.write_bytes(delta_path.read_bytes())
+
+    # a restart retrieves the snapshot and replays the deltas
+    os.remove("test.db")
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists("test.db" + suffix):
+            os.remove("test.db" + suffix)
+    restarted_db = Database(models=[TestConfig], db_filename="test.db", incremental_store=True)
+    restarted_db._name = "root.db"
+    restarted_db._restore_database()
+    assert _count_rows("test.db") == 1020
+
+    # the deltas are compacted into a new snapshot
+    _insert_rows("test.db", 1020, 1030)
+    db.store_database()
+    assert drive.list(component_name=db.name) == ["test.db"]
+    # the deltas of another snapshot are never replayed
+    assert not _apply_page_delta("test.db", str(stale_delta_path), _file_digest("test.db"), 1)
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uuid
 from unittest import mock
@@ -190,8 +191,6 @@ class TestLoadBalancerProcessRequest:
             endpoint="/predict",
         )
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
         with pytest.raises(HTTPException):
             await load_balancer.process_request("test", req_id)
 
@@ -217,7 +216,90 @@ class TestLoadBalancerProcessRequest:
         )
         load_balancer.servers.append(mock.MagicMock())
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
-        await load_balancer.process_request("test", req_id)
-        assert load_balancer._batch == [(req_id, "test")]
+        task = asyncio.create_task(load_balancer.process_request("test", req_id))
+        await asyncio.sleep(0)
+        request_id, data, future = load_balancer._batch.get_nowait()
+        assert (request_id, data) == (req_id, "test")
+        # the future is resolved by `send_batch`
+        future.set_result("Dummy")
+        assert await task == "Dummy"
+
+    @pytest.mark.asyncio
+    async def test_consumer_batches_requests(self, monkeypatch):
+        load_balancer = _LoadBalancer(
+            input_type=Text, output_type=Text, endpoint="/predict", max_batch_size=2, timeout_batching=0.1
+        )
+        load_balancer.servers.append("server")
+        load_balancer._server_status["server"] = True
+        batches = []
+
+        async def send_batch(_, batch, server_url):
+            batches.append([data for _, data, _ in batch])
+            for _, data, future in batch:
+                future.set_result(data.upper())
+            load_balancer._server_status[server_url] = True
+            load_balancer._server_freed.set()
+
+        monkeypatch.setattr(_LoadBalancer, "send_batch", send_batch)
+        consumer = asyncio.create_task(load_balancer.consumer())
+        try:
+            # a full batch is sent right away, the last request waits for `timeout_batching`
+            start = time.monotonic()
+            results = await asyncio.gather(*(load_balancer.process_request(data) for data in ("a", "b", "c")))
+            assert results == ["A", "B", "C"]
+            assert batches == [["a", "b"], ["c"]]
+            assert time.monotonic() - start < 1
+        finally:
+            consumer.cancel()
+
+    @pytest.mark.asyncio
+    async def test_consumer_waits_for_free_server(self, monkeypatch):
+        load_balancer = _LoadBalancer(
+            input_type=Text, output_type=Text, endpoint="/predict", max_batch_size=4, timeout_batching=0
+        )
+        load_balancer.servers.append("server")
+        load_balancer._server_status["server"] = False
+        sent = asyncio.Event()
+
+        async def send_batch(_, batch, server_url):
+            for _, data, future in batch:
+                future.set_result(len(batch))
+            sent.set()
+
+        monkeypatch.setattr(_LoadBalancer, "send_batch", send_batch)
+        consumer = asyncio.create_task(load_balancer.consumer())
+        try:
+            tasks = [asyncio.create_task(load_balancer.process_request(data)) for data in ("a", "b")]
+            await asyncio.sleep(0.05)
+            assert not sent.is_set()
+            # freeing the server wakes the consumer up, the requests that arrived in the meantime join the batch
+            load_balancer._server_status["server"] = True
+            load_balancer._server_freed.set()
+            assert await asyncio.gather(*tasks) == [2, 2]
+        finally:
+            consumer.cancel()
+
+    @pytest.mark.asyncio
+    async def test_send_batch_resolves_futures(self):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict")
+        load_balancer._server_status["server"] = False
+        loop = asyncio.get_running_loop()
+        batch = [(str(i), Text(text=str(i)), loop.create_future()) for i in range(2)]
+
+        response = mock.MagicMock(status=200)
+        response.json = mock.AsyncMock(return_value={"outputs": ["x", "y"]})
+        session = mock.MagicMock(closed=False)
+        session.post.return_value.__aenter__ = mock.AsyncMock(return_value=response)
+        session.post.return_value.__aexit__ = mock.AsyncMock(return_value=None)
+        load_balancer._session = session
+
+        await load_balancer.send_batch(batch, "server")
+        assert [future.result() for _, _, future in batch] == ["x", "y"]
+        assert load_balancer._server_status["server"]
+        assert load_balancer._server_freed.is_set()
+
+        # the session is shared across batches
+        batch = [("3", Text(text="3"), loop.create_future())]
+        await load_balancer.send_batch(batch, "server")
+        assert isinstance(batch[0][2].result(), RuntimeError)
+        assert session.post.call_count == 2
@@ -14,6 +14,7 @@ import pytest
 import requests
 from deepdiff import DeepDiff, Delta
 from fastapi import HTTPException, Request
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from pydantic import BaseModel
 
@@ -22,6 +23,7 @@ from lightning_app import LightningApp, LightningFlow, LightningWork
 from lightning_app.api.http_methods import Post
 from lightning_app.core import api
 from lightning_app.core.api import (
+    _StateBroadcaster,
     fastapi_service,
     global_app_state_store,
     register_global_routes,
@@ -207,6 +209,59 @@ def test_update_publish_state_and_maybe_refresh_ui():
     global_app_state_store.add("1234")
 
 
+def test_state_broadcaster_catch_up():
+    broadcaster = _StateBroadcaster(history_size=2)
+    broadcaster.publish({"vars": {"counter": 0}})
+    broadcaster.publish({"vars": {"counter": 0}})
+    assert broadcaster.version == 1
+
+    broadcaster.publish({"vars": {"counter": 1}})
+    broadcaster.publish({"vars": {"counter": 2}})
+    assert broadcaster.version == 3
+    assert broadcaster.catch_up(3) == []
+    assert broadcaster.catch_up(2) == [
+        {
+            "type": "delta",
+            "version": 3,
+            "delta": {"values_changed": {"root['vars']['counter']": {"new_value": 2, "old_value": 1}}},
+        }
+    ]
+    assert [message["version"] for message in broadcaster.catch_up(1)] == [2, 3]
+
+    # the client is too far behind or comes from another server, it receives the full state
+    expected = [{"type": "state", "version": 3, "state": {"vars": {"counter": 2}}}]
+    assert broadcaster.catch_up(0) == expected
+    assert broadcaster.catch_up(-1) == expected
+    assert broadcaster.catch_up(10) == expected
+
+
+def test_state_websocket_pushes_deltas(monkeypatch):
+    broadcaster = _StateBroadcaster()
+    monkeypatch.setattr(api, "state_broadcaster", broadcaster)
+    monkeypatch.setattr(api, "ENABLE_STATE_WEBSOCKET", True)
+    broadcaster.publish({"vars": {"counter": 0}})
+
+    client = TestClient(fastapi_service)
+    with client.websocket_connect("/api/v1/ws?version=-1") as websocket:
+        assert websocket.receive_json() == {"type": "state", "version": 1, "state": {"vars": {"counter": 0}}}
+        broadcaster.publish({"vars": {"counter": 1}})
+        assert websocket.receive_json() == {
+            "type": "delta",
+            "version": 2,
+            "delta": {"values_changed": {"root['vars']['counter']": {"new_value": 1, "old_value": 0}}},
+        }
+
+    broadcaster.publish({"vars": {"counter": 2}})
+    with client.websocket_connect("/api/v1/ws?version=2") as websocket:
+        assert websocket.receive_json()["version"] == 3
+        broadcaster.publish({"vars": {"counter": 3}})
+        assert websocket.receive_json()["version"] == 4
+
+    with client.websocket_connect("/api/v1/ws") as websocket:
+        broadcaster.publish({"vars": {"counter": 4}})
+        assert websocket.receive_text() == "5"
+
+
 @pytest.mark.parametrize("x_lightning_type", ["DEFAULT", "STREAMLIT"])
 @pytest.mark.anyio
 async def test_start_server(x_lightning_type, monkeypatch):
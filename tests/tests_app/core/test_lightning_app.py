@@ -23,7 +23,7 @@ from lightning_app.frontend import StreamlitFrontend
 from lightning_app.runners import MultiProcessRuntime
 from lightning_app.storage import Path
 from lightning_app.storage.path import _storage_root_dir
-from lightning_app.testing.helpers import _RunIf
+from lightning_app.testing.helpers import _MockQueue, _RunIf
 from lightning_app.testing.testing import LightningTestApp
 from lightning_app.utilities.app_helpers import affiliation
 from lightning_app.utilities.enum import AppStage, WorkStageStatus, WorkStopReasons
@@ -452,8 +452,9 @@ def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQu
     time window."""
 
     class SlowQueue(queue_type_cls):
-        def get(self, timeout):
-            out = super().get(timeout)
+        def get_many(self, max_items, timeout=None):
+            # one delta per call so that the aggregation is bound by the time window
+            out = super().get_many(1, timeout)
             sleep(sleep_time)
             return out
 
@@ -482,12 +483,36 @@ def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQu
         assert generated > expect
 
 
+def test_lightning_app_aggregation_fetches_many_deltas():
+    """Verify the deltas available in the queue are fetched with a single call."""
+
+    class BatchQueue(_MockQueue):
+        calls = 0
+
+        def get_many(self, max_items, timeout=None):
+            BatchQueue.calls += 1
+            items = [self.get(timeout)]
+            while self._queue and len(items) < max_items:
+                items.append(self._queue.pop(0))
+            return items
+
+    app = LightningApp(EmptyFlow())
+    app.delta_queue = BatchQueue("api_delta_queue")
+    for i in range(5):
+        app.delta_queue.put(_DeltaRequest(Delta({"values_changed": {"root['vars']['counter']": {"new_value": i}}})))
+
+    deltas = app._collect_deltas_from_ui_and_work_queues()
+    assert len(deltas) == 5
+    # one call to fetch the deltas and one call finding the queue empty
+    assert BatchQueue.calls == 2
+
+
 def test_lightning_app_aggregation_empty():
     """Verify the while loop exits before `state_accumulate_wait` is reached if no deltas are found."""
 
     class SlowQueue(MultiProcessQueue):
-        def get(self, timeout):
-            out = super().get(timeout)
+        def get_many(self, max_items, timeout=None):
+            out = super().get_many(max_items, timeout)
             return out
 
     app = LightningApp(EmptyFlow())
@@ -10,7 +10,14 @@ import requests_mock
 from lightning_app import LightningFlow
 from lightning_app.core import queues
 from lightning_app.core.constants import HTTP_QUEUE_URL
-from lightning_app.core.queues import BaseQueue, QueuingSystem, READINESS_QUEUE_CONSTANT, RedisQueue
+from lightning_app.core.queues import (
+    BaseQueue,
+    HTTPQueue,
+    QueueSerializer,
+    QueuingSystem,
+    READINESS_QUEUE_CONSTANT,
+    RedisQueue,
+)
 from lightning_app.utilities.imports import _is_redis_available
 from lightning_app.utilities.redis import check_if_redis_running
 
@@ -27,7 +34,7 @@ def test_queue_api(queue_type, monkeypatch):
     blpop_out = (b"entry-id", pickle.dumps("test_entry"))
 
     monkeypatch.setattr(redis.Redis, "blpop", lambda *args, **kwargs: blpop_out)
-    monkeypatch.setattr(redis.Redis, "rpush", lambda *args, **kwargs: None)
+    monkeypatch.setattr(redis.Redis, "rpush", lambda *args, **kwargs: 1)
     monkeypatch.setattr(redis.Redis, "set", lambda *args, **kwargs: None)
     monkeypatch.setattr(redis.Redis, "get", lambda *args, **kwargs: None)
 
@@ -161,6 +168,53 @@ def test_redis_raises_error_if_failing(redis_mock):
         my_queue.length()
 
 
+def test_process_queue_get_many_put_many():
+    my_queue = QueuingSystem.MULTIPROCESS.get_readiness_queue()
+    my_queue.put_many([1, 2, 3])
+    # wait for the feeder thread of the multiprocessing queue
+    time.sleep(0.1)
+    assert my_queue.get_many(2) == [1, 2]
+    assert my_queue.get_many(5) == [3]
+    with pytest.raises(queue.Empty):
+        my_queue.get_many(5, timeout=0)
+
+
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+@mock.patch("lightning_app.core.queues.redis.Redis")
+def test_redis_queue_get_many_put_many(redis_mock):
+    redis_queue = QueuingSystem.REDIS.get_readiness_queue()
+
+    redis_mock.return_value.rpush.return_value = 3
+    redis_queue.put_many(["a", "b", "c"])
+    # a single push without a length check
+    redis_mock.return_value.rpush.assert_called_once_with(
+        "READINESS_QUEUE", pickle.dumps("a"), pickle.dumps("b"), pickle.dumps("c")
+    )
+    redis_mock.return_value.llen.assert_not_called()
+
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", pickle.dumps("a"))
+    pipeline = redis_mock.return_value.pipeline.return_value
+    pipeline.execute.return_value = [[pickle.dumps("b"), pickle.dumps("c")], True]
+    assert redis_queue.get_many(10, timeout=1) == ["a", "b", "c"]
+    pipeline.lrange.assert_called_once_with("READINESS_QUEUE", 0, 8)
+    pipeline.ltrim.assert_called_once_with("READINESS_QUEUE", 9, -1)
+
+
+def test_queue_serializer():
+    serializer = QueueSerializer(compression_threshold=100)
+    assert serializer.dumps("a") == pickle.dumps("a")
+
+    item = ["a" * 1000]
+    value = serializer.dumps(item)
+    assert len(value) < len(pickle.dumps(item))
+    assert serializer.loads(value) == item
+
+    # the readers decode the compressed payloads whatever their own threshold is
+    serializer = QueueSerializer(compression_threshold=0)
+    assert serializer.loads(value) == item
+    assert serializer.dumps(item) == pickle.dumps(item)
+
+
 class TestHTTPQueue:
     def test_http_queue_failure_on_queue_name(self):
         test_queue = QueuingSystem.HTTP.get_queue(queue_name="test")
@@ -214,3 +268,96 @@ class TestHTTPQueue:
             content=pickle.dumps("test"),
         )
         assert test_queue.get() == "test"
+
+    def test_http_queue_get_many_put_many(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        length = adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"0")
+        push = adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+        test_queue.put_many(["a", "b", "c"])
+        # the length is only checked once
+        assert length.call_count == 1
+        assert push.call_count == 3
+
+        adapter.register_uri(
+            "POST",
+            f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop",
+            [
+                {"status_code": 200, "content": pickle.dumps("a")},
+                {"status_code": 200, "content": pickle.dumps("b")},
+                {"status_code": 204},
+            ],
+        )
+        assert test_queue.get_many(10) == ["a", "b"]
+
+    def test_http_queue_get_long_poll(self, monkeypatch):
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+        sleep_mock = mock.MagicMock()
+        monkeypatch.setattr(queues.time, "sleep", sleep_mock)
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        pop = adapter.register_uri(
+            "POST",
+            f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop",
+            [
+                {"status_code": 204},
+                {"status_code": 204},
+                {"status_code": 200, "content": pickle.dumps("test")},
+            ],
+        )
+        assert test_queue.get() == "test"
+        # the timeout is sent to the server so that it can hold the request open
+        assert pop.last_request.qs["timeout"] == [str(queues.HTTP_QUEUE_LONG_POLL_TIMEOUT)]
+        # the server answered right away, the client backs off exponentially
+        assert sleep_mock.call_args_list == [mock.call(0.05), mock.call(0.1)]
+
+        # a single request without timeout
+        pop = adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop", status_code=204)
+        with pytest.raises(queue.Empty):
+            test_queue.get(timeout=0)
+        assert "timeout" not in pop.last_request.qs
+
+    def test_http_queue_get_timeout(self, monkeypatch):
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop", status_code=204)
+        start = time.monotonic()
+        with pytest.raises(queue.Empty):
+            test_queue.get(timeout=0.2)
+        assert 0.2 <= time.monotonic() - start < 1
+
+    def test_http_queue_put_samples_length(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_LENGTH_CHECK_INTERVAL", 3)
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        length = adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"0")
+        push = adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+        for i in range(4):
+            test_queue.put(i)
+        assert push.call_count == 4
+        assert length.call_count == 2
+
+    def test_http_queue_serializer(self):
+        test_queue = HTTPQueue("test_http_queue", 0, serializer=QueueSerializer(compression_threshold=10))
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        adapter.register_uri("GET", f"{HTTP_QUEUE_URL}/v1/test/http_queue/length", content=b"0")
+        push = adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+        test_queue.put("a" * 100)
+        value = push.last_request.body
+        assert len(value) < len(pickle.dumps("a" * 100))
+
+        adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop", content=value)
+        assert test_queue.get() == "a" * 100
+
+        # the serializer is kept when the queue is sent to the works
+        state = test_queue.to_dict()
+        state.pop("type")
+        assert HTTPQueue.from_dict(state).serializer.compression_threshold == 10
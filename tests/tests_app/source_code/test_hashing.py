@@ -0,0 +1,63 @@
+import os
+import time
+from unittest import mock
+
+from lightning_app.source_code import hashing
+from lightning_app.source_code.hashing import _get_hash
+
+
+def _write_files(path, contents, age=0.0):
+    files = []
+    for name, content in contents.items():
+        file = path / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content)
+        mtime = time.time() - age
+        os.utime(file, (mtime, mtime))
+        files.append(str(file))
+    return files
+
+
+def test_get_hash_is_deterministic(tmp_path):
+    files = _write_files(tmp_path / "a", {"x.py": "x", "nested/y.py": "y"})
+    checksum = _get_hash(files, root=str(tmp_path / "a"))
+    assert _get_hash(files[::-1], root=str(tmp_path / "a"), num_workers=1) == checksum
+
+    # the hash doesn't depend on where the directory is
+    other_files = _write_files(tmp_path / "b", {"x.py": "x", "nested/y.py": "y"})
+    assert _get_hash(other_files, root=str(tmp_path / "b")) == checksum
+
+    # but renaming a file changes it
+    renamed_files = _write_files(tmp_path / "c", {"z.py": "x", "nested/y.py": "y"})
+    assert _get_hash(renamed_files, root=str(tmp_path / "c")) != checksum
+    assert _get_hash(files, root=str(tmp_path / "a"), algorithm="md5") != checksum
+
+
+def test_get_hash_cache(tmp_path):
+    root = tmp_path / "repo"
+    cache_file = tmp_path / "cache" / "hashes.json"
+    files = _write_files(root, {"x.py": "x", "y.py": "y"}, age=10)
+    checksum = _get_hash(files, root=str(root), cache_file=cache_file)
+    assert cache_file.exists()
+
+    with mock.patch.object(hashing, "_get_file_hash", wraps=hashing._get_file_hash) as get_file_hash:
+        assert _get_hash(files, root=str(root), cache_file=cache_file) == checksum
+        get_file_hash.assert_not_called()
+
+        # only the modified file is hashed again
+        _write_files(root, {"x.py": "xx"}, age=10)
+        new_checksum = _get_hash(files, root=str(root), cache_file=cache_file)
+        assert new_checksum != checksum
+        assert get_file_hash.call_count == 1
+        assert new_checksum == _get_hash(files, root=str(root))
+
+        # the files that were just modified aren't cached
+        get_file_hash.reset_mock()
+        _write_files(root, {"x.py": "xy"})
+        _get_hash(files, root=str(root), cache_file=cache_file)
+        _get_hash(files, root=str(root), cache_file=cache_file)
+        assert get_file_hash.call_count == 2
+
+    # a corrupted cache is ignored
+    cache_file.write_text("{")
+    assert _get_hash(files, root=str(root), cache_file=cache_file) == _get_hash(files, root=str(root))
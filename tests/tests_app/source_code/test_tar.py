@@ -2,10 +2,18 @@ import math
 import os
 import tarfile
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
-from lightning_app.source_code.tar import _get_dir_size_and_count, _get_split_size, _tar_path, MAX_SPLIT_COUNT
+from lightning_app.source_code import tar
+from lightning_app.source_code.tar import (
+    _get_dir_size_and_count,
+    _get_split_size,
+    _tar_path,
+    _tar_path_incremental,
+    MAX_SPLIT_COUNT,
+)
 
 
 def _create_files(basedir: Path):
@@ -119,3 +127,44 @@ def test_tar_path_no_compression(tmpdir):
 
     assert (verify_dir / "f1").exists()
     assert (verify_dir / "dir" / "f2").exists()
+
+
+def test_tar_path_incremental(tmp_path, monkeypatch):
+    source_dir, inner_dir = _create_files(tmp_path)
+    (source_dir / "empty").write_text("")
+    big_content = os.urandom(5000)
+    (inner_dir / "f3").write_bytes(big_content)
+    files = [str(source_dir / "f1"), str(source_dir / "empty"), str(inner_dir / "f2"), str(inner_dir / "f3")]
+    cache_dir = tmp_path / "cache"
+
+    target_file = tmp_path / "target.tar.gz"
+    results = _tar_path_incremental(str(source_dir), files, str(target_file), cache_dir)
+    assert results.before_size == 5004
+    assert results.after_size == target_file.stat().st_size
+
+    with tarfile.open(target_file) as target_tar:
+        assert sorted(target_tar.getnames()) == [".", "./dir", "./dir/f2", "./dir/f3", "./empty", "./f1"]
+        target_tar.extractall(tmp_path / "verify")
+    assert (tmp_path / "verify" / "f1").read_text() == "f1"
+    assert (tmp_path / "verify" / "empty").read_text() == ""
+    assert (tmp_path / "verify" / "dir" / "f3").read_bytes() == big_content
+
+    # only the entry of the modified file is compressed again
+    num_entries = len(list(cache_dir.iterdir()))
+    assert num_entries == 6
+    (source_dir / "f1").write_text("f1 modified")
+    write_tar_entry = mock.Mock(wraps=tar._write_tar_entry)
+    monkeypatch.setattr(tar, "_write_tar_entry", write_tar_entry)
+    _tar_path_incremental(str(source_dir), files, str(target_file), cache_dir)
+    assert write_tar_entry.call_count == 1
+    assert write_tar_entry.call_args.args[1] == str(source_dir / "f1")
+
+    with tarfile.open(target_file) as target_tar:
+        target_tar.extractall(tmp_path / "verify_modified")
+    assert (tmp_path / "verify_modified" / "f1").read_text() == "f1 modified"
+    assert (tmp_path / "verify_modified" / "dir" / "f2").read_text() == "f2"
+
+    # the entries that aren't used anymore expire
+    monkeypatch.setattr(tar, "_TAR_ENTRY_CACHE_TTL", -1)
+    _tar_path_incremental(str(source_dir), files[:1], str(target_file), cache_dir)
+    assert len(list(cache_dir.iterdir())) == 0
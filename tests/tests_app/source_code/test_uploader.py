@@ -1,3 +1,7 @@
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from unittest.mock import ANY, MagicMock
 
@@ -47,3 +51,96 @@ def test_file_uploader_failing_when_no_etag():
 
     with pytest.raises(ValueError, match=f"Unexpected response from {presigned_url}, response"):
         file_uploader.upload()
+
+
+class _PartServer(ThreadingHTTPServer):
+    """Stands in for the presigned urls of a multipart upload, it drops the connection of the failing parts."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _PartHandler)
+        self.parts = {}
+        self.requests = []
+        self.failures = {}
+
+
+class _PartHandler(BaseHTTPRequestHandler):
+    def do_PUT(self):
+        part_number = int(self.path.strip("/"))
+        data = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(part_number)
+        if self.server.failures.get(part_number, 0) > 0:
+            self.server.failures[part_number] -= 1
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return
+        self.server.parts[part_number] = data
+        self.send_response(200)
+        self.send_header("ETag", f"etag-{part_number}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def part_server():
+    server = _PartServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_file_uploader_multipart(tmp_path, part_server):
+    data = os.urandom(10_000)
+    source_file = tmp_path / "source.tar.gz"
+    source_file.write_bytes(data)
+    urls = {n: f"http://127.0.0.1:{part_server.server_port}/{n}" for n in (1, 2, 3)}
+
+    file_uploader = uploader.FileUploader(
+        presigned_url=urls, source_file=str(source_file), total_size=len(data), name="source.tar.gz"
+    )
+    file_uploader.progress = MagicMock()
+    file_uploader.disconnect_retry_wait_seconds = 0
+    # the second part is dropped once and retried on its own
+    part_server.failures[2] = 1
+
+    assert file_uploader.upload() == {1: "etag-1", 2: "etag-2", 3: "etag-3"}
+    assert b"".join(part_server.parts[n] for n in (1, 2, 3)) == data
+    assert sorted(part_server.requests) == [1, 2, 2, 3]
+    assert sum(c.kwargs["advance"] for c in file_uploader.progress.update.call_args_list) == len(data)
+
+
+def test_file_uploader_multipart_resume(tmp_path, part_server):
+    data = os.urandom(10_000)
+    source_file = tmp_path / "source.tar.gz"
+    source_file.write_bytes(data)
+    urls = {n: f"http://127.0.0.1:{part_server.server_port}/{n}" for n in (1, 2, 3)}
+
+    file_uploader = uploader.FileUploader(
+        presigned_url=urls, source_file=str(source_file), total_size=len(data), name="source.tar.gz"
+    )
+    file_uploader.progress = MagicMock()
+    file_uploader.disconnect_retry_wait_seconds = 0
+    file_uploader.part_retries = 2
+    part_server.failures[3] = 2
+
+    with pytest.raises(ValueError, match="Unable to upload the part 3"):
+        file_uploader.upload()
+    assert file_uploader.completed_parts == {1: "etag-1", 2: "etag-2"}
+
+    # only the missing part is uploaded when resuming
+    part_server.requests.clear()
+    resumed_uploader = uploader.FileUploader(
+        presigned_url=urls,
+        source_file=str(source_file),
+        total_size=len(data),
+        name="source.tar.gz",
+        completed_parts=file_uploader.completed_parts,
+    )
+    resumed_uploader.progress = MagicMock()
+    assert resumed_uploader.upload() == {1: "etag-1", 2: "etag-2", 3: "etag-3"}
+    assert part_server.requests == [3]
+    assert b"".join(part_server.parts[n] for n in (1, 2, 3)) == data
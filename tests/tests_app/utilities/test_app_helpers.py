@@ -13,9 +13,11 @@ from lightning_cloud.openapi import (
 from lightning_app import LightningApp, LightningFlow, LightningWork
 from lightning_app.core.flow import _RootFlow
 from lightning_app.frontend import StaticWebFrontend
+from lightning_app.storage import Path
 from lightning_app.utilities.app_helpers import (
     _handle_is_headless,
     _is_headless,
+    _is_state_equal,
     _MagicMockJsonSerializable,
     AppStatePlugin,
     BaseStatePlugin,
@@ -51,6 +53,30 @@ def test_is_overridden():
     assert is_overridden("run", work)
 
 
+@pytest.mark.parametrize(
+    "state, other, expected",
+    [
+        ({"vars": {"a": 1, "b": [1, (2, 3)]}}, {"vars": {"a": 1, "b": [1, (2, 3)]}}, True),
+        ({"vars": {"a": 1}}, {"vars": {"a": 1.0}}, False),
+        ({"vars": {"a": 1}}, {"vars": {"a": 1, "b": 2}}, False),
+        ({"vars": {"a": [1, 2]}}, {"vars": {"a": [1, 2, 3]}}, False),
+        ({"vars": {"a": [1, 2]}}, {"vars": {"a": (1, 2)}}, False),
+        ({"vars": {"a": Path("a")}}, {"vars": {"a": Path("a")}}, True),
+        ({"vars": {"a": Path("a")}}, {"vars": {"a": Path("b")}}, False),
+    ],
+)
+def test_is_state_equal(state, other, expected):
+    assert _is_state_equal(state, other) is expected
+    assert _is_state_equal(other, state) is expected
+
+
+def test_is_state_equal_path_metadata():
+    path = Path("a")
+    other = Path("a")
+    other._origin = "root.work"
+    assert not _is_state_equal(path, other)
+
+
 def test_simple_app_store():
 
     store = InMemoryStateStore()
@@ -606,6 +606,84 @@ def test_work_state_observer():
     assert not observer._delta_memory
 
 
+def test_work_state_observer_only_diffs_changed_vars():
+    """Tests that the WorkStateObserver and the setattr proxy only diff the state variables that changed."""
+
+    class Work(LightningWork):
+        def __init__(self):
+            super().__init__()
+            self.var = 1
+            self.large = {str(i): list(range(10)) for i in range(100)}
+            self.list = []
+
+        def run(self):
+            pass
+
+    work = Work()
+    delta_queue = _MockQueue()
+    observer = WorkStateObserver(work, delta_queue)
+    work._setattr_replacement = LightningWorkSetAttrProxy(
+        work=work, work_name="work_name", delta_queue=delta_queue, state_observer=observer
+    )
+
+    with mock.patch("lightning_app.utilities.proxies.DeepDiff", wraps=DeepDiff) as deep_diff:
+        observer.run_once()
+        deep_diff.assert_not_called()
+        assert len(delta_queue) == 0
+
+        work.var = 2
+        assert deep_diff.call_args.args == ({"vars": {"var": 1}}, {"vars": {"var": 2}})
+        assert delta_queue.get().delta.to_dict() == {"values_changed": {"root['vars']['var']": {"new_value": 2}}}
+
+        deep_diff.reset_mock()
+        work.list.append(1)
+        work.large["0"].append(10)
+        observer.run_once()
+        previous, current = deep_diff.call_args.args
+        assert set(previous["vars"]) == set(current["vars"]) == {"list", "large"}
+        assert delta_queue.get().delta.to_dict() == {
+            "iterable_item_added": {"root['vars']['large']['0'][10]": 10, "root['vars']['list'][0]": 1}
+        }
+
+        # the last state was updated in-place with the deltas from the proxy and the observer
+        deep_diff.reset_mock()
+        observer.run_once()
+        deep_diff.assert_not_called()
+        assert observer._last_state == work.state
+        assert len(delta_queue) == 0
+
+    # the changes to the values sent to the flow don't leak into the last state
+    work.list = [1, 2]
+    sent = delta_queue.get().delta
+    observer.run_once()
+    observer._last_state["vars"]["list"].append(3)
+    assert sent.to_dict() == {"iterable_item_added": {"root['vars']['list'][1]": 2}}
+
+
+def test_work_state_observer_detects_nested_type_changes():
+    """Tests that the WorkStateObserver sends the type changes nested in a state variable."""
+
+    class NestedWork(LightningWork):
+        def __init__(self):
+            super().__init__()
+            self.x = {"a": 1, "b": {"c": True}}
+
+        def run(self):
+            pass
+
+    work = NestedWork()
+    delta_queue = _MockQueue()
+    observer = WorkStateObserver(work, delta_queue)
+
+    work.x["a"] = 1.0
+    work.x["b"]["c"] = 1
+    observer.run_once()
+    delta = delta_queue.get().delta.to_dict()
+    assert set(delta["type_changes"]) == {"root['vars']['x']['a']", "root['vars']['x']['b']['c']"}
+    assert type(observer._last_state["vars"]["x"]["a"]) is float
+    assert type(observer._last_state["vars"]["x"]["b"]["c"]) is int
+
+
 class WorkState(LightningWork):
     def __init__(self):
         super().__init__(parallel=True)
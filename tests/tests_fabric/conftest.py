@@ -16,6 +16,7 @@ from typing import List
 
 import pytest
 import torch.distributed
+from fsspec.implementations.memory import MemoryFileSystem
 
 import lightning_fabric
 
@@ -87,6 +88,14 @@ def tpu_available(xla_available, monkeypatch) -> None:
     monkeypatch.setattr(lightning_fabric.accelerators.tpu.TPUAccelerator, "is_available", lambda: True)
 
 
+@pytest.fixture
+def memory_filesystem():
+    """Yields the process-global in-memory filesystem of ``fsspec`` and clears it after the test."""
+    yield MemoryFileSystem()
+    MemoryFileSystem.store.clear()
+    MemoryFileSystem.pseudo_dirs[:] = [""]
+
+
 @pytest.fixture
 def caplog(caplog):
     """Workaround for https://github.com/pytest-dev/pytest/issues/3697.
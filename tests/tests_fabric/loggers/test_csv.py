@@ -94,3 +94,53 @@ def test_flush_n_steps(tmpdir):
     logger.save.assert_not_called()
     logger.log_metrics(metrics, step=1)
     logger.save.assert_called_once()
+
+
+def test_append_expand_list_of_keys(tmpdir):
+    """Test that saving appends the new rows and extends the header when new keys show up."""
+    writer = _ExperimentWriter(log_dir=str(tmpdir))
+    writer.log_metrics({"a": 1})
+    writer.save()
+    writer.log_metrics({"a": 2})
+    writer.save()
+    assert not writer.metrics
+    writer.log_metrics({"b": 3, "a": 4})
+    writer.log_metrics({"c": 5})
+    writer.save()
+    writer.log_metrics({"a": 6})
+    writer.save()
+
+    with open(writer.metrics_file_path) as fp:
+        lines = fp.read().splitlines()
+    assert lines == ["a,step,b,c", "1,0,,", "2,1,,", "4,2,3,", ",3,,5", "6,4,,"]
+    assert not os.path.exists(writer.metrics_file_path + ".tmp")
+
+
+def test_experiment_writer_flush_budget(tmpdir, monkeypatch):
+    """Test that the writer saves the recorded rows on its own once the row or time budget is exhausted."""
+    writer = _ExperimentWriter(log_dir=str(tmpdir), max_buffered_rows=3)
+    writer.log_metrics({"a": 1})
+    writer.log_metrics({"a": 2})
+    assert not os.path.exists(writer.metrics_file_path)
+    writer.log_metrics({"a": 3})
+    assert not writer.metrics
+    with open(writer.metrics_file_path) as fp:
+        assert len(fp.readlines()) == 4
+
+    monotonic = MagicMock(return_value=0.0)
+    monkeypatch.setattr("lightning_fabric.loggers.csv_logs.time.monotonic", monotonic)
+    writer = _ExperimentWriter(log_dir=str(tmpdir / "timed"), flush_interval=10.0)
+    writer.log_metrics({"a": 1})
+    assert writer.metrics
+    monotonic.return_value = 10.0
+    writer.log_metrics({"a": 2})
+    assert not writer.metrics
+    with open(writer.metrics_file_path) as fp:
+        assert len(fp.readlines()) == 3
+
+
+def test_csv_logger_flush_budget(tmpdir):
+    """Test that the flush budget of the logger is passed to its experiment writer."""
+    logger = CSVLogger(tmpdir, max_buffered_rows=5, flush_interval=2.5)
+    assert logger.experiment.max_buffered_rows == 5
+    assert logger.experiment.flush_interval == 2.5
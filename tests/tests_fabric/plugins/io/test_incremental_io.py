@@ -0,0 +1,91 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from unittest import mock
+
+import torch
+
+from lightning_fabric.plugins.io.incremental_io import IncrementalCheckpointIO
+from lightning_fabric.plugins.io.mmap_io import MmapCheckpointIO
+
+
+def _blobs(tmpdir):
+    return set(os.listdir(tmpdir / ".tensors"))
+
+
+def test_incremental_checkpoint_io_deduplicates_unchanged_tensors(tmpdir):
+    frozen = torch.randn(8, 8)
+    head = torch.zeros(8)
+    checkpoint_io = IncrementalCheckpointIO()
+
+    checkpoint_io.save_checkpoint({"state_dict": {"frozen": frozen, "head": head}, "step": 0}, tmpdir / "0.ckpt")
+    assert len(_blobs(tmpdir)) == 2
+
+    head.add_(1)
+    with mock.patch("lightning_fabric.plugins.io.incremental_io._write_blob") as write_mock:
+        checkpoint_io.save_checkpoint({"state_dict": {"frozen": frozen, "head": head}, "step": 1}, tmpdir / "1.ckpt")
+    # only the modified tensor gets written
+    write_mock.assert_called_once()
+    assert write_mock.call_args.args[1].endswith(".bin")
+
+    checkpoint_io.save_checkpoint({"state_dict": {"frozen": frozen, "head": head}, "step": 1}, tmpdir / "1.ckpt")
+    assert len(_blobs(tmpdir)) == 3
+
+    # the full state can be reconstructed, also with the base `MmapCheckpointIO`
+    for loader in (checkpoint_io, MmapCheckpointIO()):
+        loaded = loader.load_checkpoint(tmpdir / "1.ckpt")
+        assert loaded["step"] == 1
+        assert torch.equal(loaded["state_dict"]["frozen"], frozen)
+        assert torch.equal(loaded["state_dict"]["head"], torch.ones(8))
+    loaded = checkpoint_io.load_checkpoint(tmpdir / "0.ckpt")
+    assert torch.equal(loaded["state_dict"]["head"], torch.zeros(8))
+
+
+def test_incremental_checkpoint_io_detects_writes_through_data(tmpdir):
+    """Test that writes which don't bump the version counter of the tensors are saved."""
+    model = torch.nn.Linear(2, 2)
+    checkpoint_io = IncrementalCheckpointIO()
+    checkpoint_io.save_checkpoint({"state_dict": model.state_dict()}, tmpdir / "0.ckpt")
+    model.weight.data.fill_(7.0)
+    checkpoint_io.save_checkpoint({"state_dict": model.state_dict()}, tmpdir / "1.ckpt")
+    loaded = checkpoint_io.load_checkpoint(tmpdir / "1.ckpt")
+    assert torch.equal(loaded["state_dict"]["weight"], torch.full((2, 2), 7.0))
+
+
+def test_incremental_checkpoint_io_overwrite_collects_unreferenced_tensors(tmpdir):
+    shared = torch.randn(4)
+    checkpoint_io = IncrementalCheckpointIO()
+    checkpoint_io.save_checkpoint({"shared": shared, "own": torch.zeros(2)}, tmpdir / "last.ckpt")
+    checkpoint_io.save_checkpoint({"shared": shared, "own": torch.ones(2)}, tmpdir / "last.ckpt")
+    assert len(_blobs(tmpdir)) == 2
+    loaded = checkpoint_io.load_checkpoint(tmpdir / "last.ckpt")
+    assert torch.equal(loaded["shared"], shared)
+    assert torch.equal(loaded["own"], torch.ones(2))
+
+
+def test_incremental_checkpoint_io_remove_collects_unreferenced_tensors(tmpdir):
+    shared = torch.randn(4)
+    checkpoint_io = IncrementalCheckpointIO()
+    checkpoint_io.save_checkpoint({"shared": shared, "own": torch.zeros(2)}, tmpdir / "0.ckpt")
+    checkpoint_io.save_checkpoint({"shared": shared, "own": torch.ones(2)}, tmpdir / "1.ckpt")
+    assert len(_blobs(tmpdir)) == 3
+
+    checkpoint_io.remove_checkpoint(tmpdir / "0.ckpt")
+    assert not os.path.exists(tmpdir / "0.ckpt")
+    assert len(_blobs(tmpdir)) == 2
+    loaded = checkpoint_io.load_checkpoint(tmpdir / "1.ckpt")
+    assert torch.equal(loaded["shared"], shared)
+
+    checkpoint_io.remove_checkpoint(tmpdir / "1.ckpt")
+    assert not _blobs(tmpdir)
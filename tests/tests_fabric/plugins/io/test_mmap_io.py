@@ -0,0 +1,132 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import mmap
+import os
+from unittest import mock
+
+import pytest
+import torch
+
+from lightning_fabric.plugins.io.mmap_io import _is_mmap_checkpoint, MmapCheckpointIO
+
+
+def _checkpoint():
+    return {
+        "state_dict": {
+            "weight": torch.randn(4, 3),
+            "bias": torch.arange(4, dtype=torch.float64),
+            "half": torch.ones(5, dtype=torch.bfloat16),
+            "mask": torch.tensor([True, False]),
+            "scalar": torch.tensor(7),
+            "empty": torch.empty(0, 2),
+            "transposed": torch.arange(6).view(2, 3).t(),
+        },
+        "optimizer_states": [{"state": {0: {"step": torch.tensor(3.0)}}, "param_groups": [{"lr": 0.1}]}],
+        "epoch": 2,
+    }
+
+
+@pytest.mark.parametrize("max_shard_size", [1, 2**30])
+def test_mmap_checkpoint_io_roundtrip(tmpdir, max_shard_size):
+    checkpoint = _checkpoint()
+    checkpoint_io = MmapCheckpointIO(max_shard_size=max_shard_size)
+    path = tmpdir / "model.ckpt"
+    checkpoint_io.save_checkpoint(checkpoint, path)
+
+    assert _is_mmap_checkpoint(path)
+    shards = [f for f in os.listdir(path) if f.startswith("shard-")]
+    # every tensor that holds data ends up in its own shard when the shard size is tiny
+    assert len(shards) == (7 if max_shard_size == 1 else 1)
+
+    loaded = checkpoint_io.load_checkpoint(path)
+    assert loaded["epoch"] == 2
+    assert loaded["optimizer_states"][0]["param_groups"] == [{"lr": 0.1}]
+    assert torch.equal(loaded["optimizer_states"][0]["state"][0]["step"], torch.tensor(3.0))
+    for key, tensor in checkpoint["state_dict"].items():
+        assert loaded["state_dict"][key].dtype == tensor.dtype
+        assert torch.equal(loaded["state_dict"][key], tensor)
+
+
+def test_mmap_checkpoint_io_lazy_loading(tmpdir):
+    path = tmpdir / "model.ckpt"
+    MmapCheckpointIO().save_checkpoint({"weight": torch.zeros(16)}, path)
+
+    with mock.patch.object(mmap, "mmap", wraps=mmap.mmap) as mmap_mock:
+        loaded = MmapCheckpointIO().load_checkpoint(path)
+    mmap_mock.assert_called_once()
+    assert mmap_mock.call_args.kwargs["access"] == mmap.ACCESS_COPY
+
+    # the mapping is copy-on-write, modifying the loaded tensor does not modify the file
+    loaded["weight"].add_(1)
+    assert torch.equal(MmapCheckpointIO().load_checkpoint(path)["weight"], torch.zeros(16))
+
+
+def test_mmap_checkpoint_io_map_location(tmpdir):
+    path = tmpdir / "model.ckpt"
+    MmapCheckpointIO().save_checkpoint({"weight": torch.zeros(2)}, path)
+    loaded = MmapCheckpointIO().load_checkpoint(path, map_location="meta")
+    assert loaded["weight"].device == torch.device("meta")
+    loaded = MmapCheckpointIO().load_checkpoint(path, map_location={"cpu": "meta"})
+    assert loaded["weight"].device == torch.device("meta")
+    loaded = MmapCheckpointIO().load_checkpoint(path, map_location=lambda storage, loc: storage)
+    assert loaded["weight"].device == torch.device("cpu")
+
+
+def test_mmap_checkpoint_io_overwrite_and_remove(tmpdir):
+    checkpoint_io = MmapCheckpointIO(max_shard_size=1)
+    path = tmpdir / "model.ckpt"
+    checkpoint_io.save_checkpoint({"a": torch.zeros(2), "b": torch.zeros(2)}, path)
+    checkpoint_io.save_checkpoint({"a": torch.ones(2)}, path)
+    # shards of the previous checkpoint don't linger around
+    files = sorted(os.listdir(path))
+    assert len(files) == 3
+    assert files[0] == "index.json"
+    assert files[1].startswith("metadata-")
+    assert files[2].startswith("shard-") and files[2].endswith("-00000.bin")
+    assert torch.equal(checkpoint_io.load_checkpoint(path)["a"], torch.ones(2))
+
+    checkpoint_io.remove_checkpoint(path)
+    assert not os.path.exists(path)
+    with pytest.raises(FileNotFoundError, match="not found"):
+        checkpoint_io.load_checkpoint(path)
+
+
+def test_mmap_checkpoint_io_keeps_previous_checkpoint_on_failure(tmpdir):
+    checkpoint_io = MmapCheckpointIO(max_shard_size=1)
+    path = tmpdir / "model.ckpt"
+    checkpoint_io.save_checkpoint({"a": torch.zeros(2), "b": torch.zeros(2)}, path)
+    with mock.patch("torch.save", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        checkpoint_io.save_checkpoint({"a": torch.ones(2), "b": torch.ones(2)}, path)
+    loaded = checkpoint_io.load_checkpoint(path)
+    assert torch.equal(loaded["a"], torch.zeros(2))
+    assert torch.equal(loaded["b"], torch.zeros(2))
+
+    # the files left behind by the failed save are cleaned up by the next one
+    checkpoint_io.save_checkpoint({"a": torch.ones(2)}, path)
+    assert len(os.listdir(path)) == 3
+
+
+def test_mmap_checkpoint_io_remote_filesystem(memory_filesystem):
+    checkpoint_io = MmapCheckpointIO(max_shard_size=1)
+    path = "memory://test_mmap_checkpoint_io_remote_filesystem/model.ckpt"
+    checkpoint_io.save_checkpoint({"weight": torch.arange(3), "bias": torch.zeros(1)}, path)
+    checkpoint_io.save_checkpoint({"weight": torch.arange(3)}, path)
+    loaded = checkpoint_io.load_checkpoint(path)
+    assert torch.equal(loaded["weight"], torch.arange(3))
+    assert len(memory_filesystem.ls(path, detail=False)) == 3
+
+
+def test_mmap_checkpoint_io_storage_options(tmpdir):
+    with pytest.raises(TypeError, match="`storage_options` arg is not supported"):
+        MmapCheckpointIO().save_checkpoint({}, tmpdir / "model.ckpt", storage_options={})
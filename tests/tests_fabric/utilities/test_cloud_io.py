@@ -11,12 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import io
 import os
+from unittest import mock
 
 import fsspec
+import pytest
+import torch
 from fsspec.implementations.local import LocalFileSystem
+from fsspec.implementations.memory import MemoryFileSystem
 
-from lightning_fabric.utilities.cloud_io import get_filesystem
+from lightning_fabric.utilities.cloud_io import _atomic_save, _load, get_filesystem
 
 
 def test_get_filesystem_custom_filesystem():
@@ -32,3 +38,41 @@ def test_get_filesystem_custom_filesystem():
 
 def test_get_filesystem_local_filesystem():
     assert isinstance(get_filesystem("tmpdir/tmp_file"), LocalFileSystem)
+
+
+@pytest.mark.parametrize("hash_algorithm", [None, "sha256"])
+def test_atomic_save_streams_to_file(tmpdir, hash_algorithm):
+    filepath = str(tmpdir / "model.ckpt")
+    with mock.patch("torch.save", wraps=torch.save) as save_mock:
+        digest = _atomic_save({"weight": torch.arange(4)}, filepath, hash_algorithm=hash_algorithm)
+    # the checkpoint is serialized straight into the file instead of an in-memory buffer
+    assert not isinstance(save_mock.call_args.args[1], io.BytesIO)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(_load(filepath)["weight"], torch.arange(4))
+    if hash_algorithm is None:
+        assert digest is None
+    else:
+        with open(filepath, "rb") as f:
+            assert digest == hashlib.sha256(f.read()).hexdigest()
+
+
+def test_atomic_save_keeps_previous_file_on_failure(tmpdir):
+    filepath = str(tmpdir / "model.ckpt")
+    _atomic_save({"weight": torch.zeros(1)}, filepath)
+    with mock.patch("torch.save", side_effect=RuntimeError("interrupted")), pytest.raises(RuntimeError):
+        _atomic_save({"weight": torch.ones(1)}, filepath)
+    # the temporary file got cleaned up and the previous checkpoint is untouched
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(_load(filepath)["weight"], torch.zeros(1))
+
+
+def test_atomic_save_remote_filesystem(memory_filesystem):
+    # remote filesystems don't have an atomic rename, the checkpoint is written directly
+    with mock.patch.object(MemoryFileSystem, "mv") as mv_mock:
+        _atomic_save({"weight": torch.arange(2)}, "memory://test_atomic_save_remote_filesystem/model.ckpt")
+    mv_mock.assert_not_called()
+    assert memory_filesystem.ls("/test_atomic_save_remote_filesystem", detail=False) == [
+        "/test_atomic_save_remote_filesystem/model.ckpt"
+    ]
+    loaded = _load("memory://test_atomic_save_remote_filesystem/model.ckpt")
+    assert torch.equal(loaded["weight"], torch.arange(2))
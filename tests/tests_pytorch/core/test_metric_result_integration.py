@@ -36,6 +36,7 @@ from pytorch_lightning.trainer.connectors.logger_connector.result import (
     _ResultMetric,
     _Sync,
 )
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests_pytorch.core.test_results import spawn_launch
 from tests_pytorch.helpers.runif import RunIf
 
@@ -616,6 +617,110 @@ def test_metric_result_dtype_promotion(reduce_fx):
     assert total.dtype == torch.double
 
 
+def test_result_metric_mean_accumulates_in_place():
+    metadata = _Metadata("foo", "bar")
+    metadata.sync = _Sync()
+    rm = _ResultMetric(metadata, is_tensor=True)
+    value, cumulated_batch_size = rm.value, rm.cumulated_batch_size
+    rm.update(torch.tensor(2.0), 3)
+    rm.update(torch.tensor(4.0), 5)
+    # the states were updated in-place
+    assert rm.value is value
+    assert rm.cumulated_batch_size is cumulated_batch_size
+    computed = rm.compute()
+    assert computed == (2 * 3 + 4 * 5) / (3 + 5)
+    rm.update(torch.tensor(1.0), 1)
+    # the returned value is not modified by later updates
+    assert computed == (2 * 3 + 4 * 5) / (3 + 5)
+
+
+def test_result_metric_mean_non_integer_batch_size():
+    metadata = _Metadata("foo", "bar")
+    metadata.sync = _Sync()
+    rm = _ResultMetric(metadata, is_tensor=True)
+    rm.update(torch.tensor(2.0), 1.5)
+    rm.update(torch.tensor(4.0), 0.5)
+    assert rm.cumulated_batch_size.is_floating_point()
+    assert rm.compute() == (2 * 1.5 + 4 * 0.5) / (1.5 + 0.5)
+
+
+def test_result_collection_log_skips_metadata_for_repeated_calls():
+    result = _ResultCollection(True)
+    result.log("training_step", "a", torch.tensor(1.0), on_step=True, batch_size=1)
+    with mock.patch(
+        "pytorch_lightning.trainer.connectors.logger_connector.result._Metadata", wraps=_Metadata
+    ) as metadata_mock:
+        result.log("training_step", "a", torch.tensor(3.0), on_step=True, batch_size=1)
+        metadata_mock.assert_not_called()
+        assert result["training_step.a"]._forward_cache == 3.0
+        assert result["training_step.a"].compute() == 2.0
+
+        # different arguments still get validated
+        with pytest.raises(MisconfigurationException, match="twice in `training_step` with different arguments"):
+            result.log("training_step", "a", torch.tensor(1.0), on_step=False, batch_size=1)
+        metadata_mock.assert_called_once()
+
+    # the cache does not end up in the state
+    assert "_log_args" not in result.state_dict()
+    result.load_state_dict(result.state_dict())
+    assert not result._log_args
+
+
+def _log_synced_metrics(result, sync_fn):
+    result.log("training_step", "a", torch.tensor(1.0), batch_size=1, sync_dist=True, sync_dist_fn=sync_fn)
+    result.log("training_step", "b", torch.tensor(3.0), batch_size=2, sync_dist=True, sync_dist_fn=sync_fn)
+    result.log(
+        "training_step",
+        "c",
+        {"x": torch.tensor(5.0), "y": torch.tensor(6.0)},
+        reduce_fx="sum",
+        sync_dist=True,
+        sync_dist_fn=sync_fn,
+    )
+    result.log("training_step", "d", torch.tensor(7.0), sync_dist=False, sync_dist_fn=sync_fn)
+
+
+def test_result_collection_buckets_sync_dist_metrics():
+    """Test that the synced epoch-level metrics are reduced with one call per bucket of states."""
+    calls = []
+
+    def sync_fn(value, reduce_op=None, group=None):
+        calls.append((value.clone(), reduce_op))
+        # simulate 2 processes logging the same values
+        return value * 2 if reduce_op == "sum" else value
+
+    result = _ResultCollection(True)
+    _log_synced_metrics(result, sync_fn)
+    metrics = result.metrics(on_step=False)
+
+    # the float states of "a" and "b", their cumulated batch sizes and the summed values of "c"
+    assert len(calls) == 3
+    assert sorted(call[0].numel() for call in calls) == [2, 2, 2]
+    assert metrics["log"] == {"a": 1.0, "b": 3.0, "c": {"x": 10.0, "y": 12.0}, "d": 7.0}
+
+    # the values are cached, further calls do not sync again
+    result.metrics(on_step=False)
+    assert len(calls) == 3
+
+
+def test_result_collection_sync_dist_fallback_for_non_elementwise_reduction():
+    """Test that a reduction which does not preserve the shape falls back to reducing every state on its own."""
+    calls = []
+
+    def sync_fn(value, reduce_op=None, group=None):
+        calls.append(value.shape)
+        # like `DataParallelStrategy.reduce` which averages over the elements
+        return value.float().mean()
+
+    result = _ResultCollection(True)
+    _log_synced_metrics(result, sync_fn)
+    metrics = result.metrics(on_step=False)
+
+    assert metrics["log"] == {"a": 1.0, "b": 3.0, "c": {"x": 5.0, "y": 6.0}, "d": 7.0}
+    # 3 bucketed calls followed by one call per state
+    assert len(calls) == 3 + 2 * 2 + 2
+
+
 @pytest.mark.parametrize(["reduce_fx", "expected"], [(max, -2), (min, 2)])
 def test_result_metric_max_min(reduce_fx, expected):
     metadata = _Metadata("foo", "bar", reduce_fx=reduce_fx)
@@ -128,3 +128,11 @@ def test_flush_n_steps(tmpdir):
     logger.save.assert_not_called()
     logger.log_metrics(metrics, step=1)
     logger.save.assert_called_once()
+
+
+def test_csv_logger_flush_budget(tmpdir):
+    """Test that the flush budget of the logger is passed to its experiment writer."""
+    logger = CSVLogger(tmpdir, max_buffered_rows=5, flush_interval=2.5)
+    assert isinstance(logger.experiment, ExperimentWriter)
+    assert logger.experiment.max_buffered_rows == 5
+    assert logger.experiment.flush_interval == 2.5
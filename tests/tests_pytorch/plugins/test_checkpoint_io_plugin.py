@@ -11,14 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock, Mock
 
+import pytest
 import torch
 
-from lightning_fabric.plugins import CheckpointIO, TorchCheckpointIO
+from lightning_fabric.plugins import CheckpointIO, IncrementalCheckpointIO, MmapCheckpointIO, TorchCheckpointIO
 from lightning_fabric.utilities.types import _PATH
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
@@ -150,3 +153,178 @@ def test_multi_wrapped_checkpoint_io_initialization():
     assert isinstance(ckpt_io.checkpoint_io.checkpoint_io, TorchCheckpointIO)
     assert ckpt_io._base_checkpoint_io_configured is True
     assert ckpt_io.checkpoint_io._base_checkpoint_io_configured is True
+
+
+def test_async_checkpoint_io_snapshot(tmpdir):
+    """Test that the checkpoint is copied into reusable host buffers before being saved in the background."""
+    release = threading.Event()
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    base_ckpt_io.save_checkpoint.side_effect = lambda *_, **__: release.wait()
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io)
+
+    weight = torch.zeros(3)
+    ckpt_io.save_checkpoint({"state_dict": {"weight": weight}, "epoch": 0}, tmpdir / "a.ckpt")
+    # the training loop keeps updating the weights in-place while the checkpoint is being written
+    weight.add_(1)
+    release.set()
+    ckpt_io.wait_for_pending()
+
+    checkpoint, path = base_ckpt_io.save_checkpoint.call_args.args
+    assert path == tmpdir / "a.ckpt"
+    assert checkpoint["epoch"] == 0
+    assert torch.equal(checkpoint["state_dict"]["weight"], torch.zeros(3))
+    buffer = ckpt_io._buffers[0][0]
+    assert checkpoint["state_dict"]["weight"] is buffer
+
+    ckpt_io.save_checkpoint({"state_dict": {"weight": weight}, "epoch": 1}, tmpdir / "b.ckpt")
+    ckpt_io.wait_for_pending()
+    checkpoint, _ = base_ckpt_io.save_checkpoint.call_args.args
+    # the buffer gets reused across saves
+    assert checkpoint["state_dict"]["weight"] is buffer
+    assert torch.equal(buffer, torch.ones(3))
+    ckpt_io.teardown()
+
+
+@pytest.mark.parametrize("max_pending", [1, 2])
+def test_async_checkpoint_io_backpressure(tmpdir, max_pending):
+    """Test that no more than `max_pending` saves can be in-flight at the same time."""
+    release = threading.Event()
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    base_ckpt_io.save_checkpoint.side_effect = lambda *_, **__: release.wait()
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io, max_pending=max_pending)
+
+    for i in range(max_pending):
+        ckpt_io.save_checkpoint({"weight": torch.zeros(1)}, tmpdir / f"{i}.ckpt")
+    assert len(ckpt_io._pending) == max_pending
+    assert not ckpt_io._free_slots
+
+    # the next save blocks until the oldest one is done
+    threading.Timer(0.1, release.set).start()
+    ckpt_io.save_checkpoint({"weight": torch.zeros(1)}, tmpdir / "last.ckpt")
+    assert release.is_set()
+    ckpt_io.teardown()
+    assert base_ckpt_io.save_checkpoint.call_count == max_pending + 1
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        AsyncCheckpointIO(max_pending=0)
+
+
+def test_async_checkpoint_io_remove_after_save(tmpdir):
+    """Test that removals wait for the pending saves and are skipped if a save failed."""
+    calls = []
+    release = threading.Event()
+
+    def save_checkpoint(checkpoint, path, *_, **__):
+        release.wait()
+        if path == "fail.ckpt":
+            raise RuntimeError("failed to save")
+        calls.append(("save", path))
+
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    base_ckpt_io.save_checkpoint.side_effect = save_checkpoint
+    base_ckpt_io.remove_checkpoint.side_effect = lambda path: calls.append(("remove", path))
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io)
+
+    ckpt_io.save_checkpoint({}, "new.ckpt")
+    ckpt_io.remove_checkpoint("old.ckpt")
+    release.set()
+    ckpt_io.wait_for_pending()
+    assert calls == [("save", "new.ckpt"), ("remove", "old.ckpt")]
+
+    release.clear()
+    ckpt_io.save_checkpoint({}, "fail.ckpt")
+    ckpt_io.remove_checkpoint("new.ckpt")
+    release.set()
+    with pytest.raises(RuntimeError, match="failed to save"):
+        ckpt_io.wait_for_pending()
+    assert calls == [("save", "new.ckpt"), ("remove", "old.ckpt")]
+
+    # the save already failed when the removal is requested: the error is raised and the file is still kept
+    ckpt_io.save_checkpoint({}, "fail.ckpt")
+    ckpt_io._pending[-1][0].exception()
+    with pytest.raises(RuntimeError, match="failed to save"):
+        ckpt_io.remove_checkpoint("new.ckpt")
+    ckpt_io.wait_for_pending()
+    assert calls == [("save", "new.ckpt"), ("remove", "old.ckpt")]
+
+    # the removals following a successful save are applied again
+    ckpt_io.save_checkpoint({}, "newer.ckpt")
+    ckpt_io.remove_checkpoint("new.ckpt")
+    ckpt_io.wait_for_pending()
+    assert calls[-2:] == [("save", "newer.ckpt"), ("remove", "new.ckpt")]
+    ckpt_io.teardown()
+
+
+def test_mmap_checkpoint_io_load_from_checkpoint(tmpdir):
+    """Test that checkpoints saved with the `MmapCheckpointIO` can be resumed from and loaded with
+    `load_from_checkpoint`."""
+    model = BoringModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[MmapCheckpointIO()],
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer.fit(model)
+    ckpt_path = trainer.checkpoint_callback.best_model_path
+    assert os.path.isfile(os.path.join(ckpt_path, "index.json"))
+
+    loaded = BoringModel.load_from_checkpoint(ckpt_path)
+    for expected, actual in zip(model.parameters(), loaded.parameters()):
+        assert torch.equal(expected, actual)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[MmapCheckpointIO()],
+        max_epochs=2,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer.fit(BoringModel(), ckpt_path=ckpt_path)
+    assert trainer.global_step == 4
+
+
+def test_incremental_checkpoint_io_frozen_backbone(tmpdir):
+    """Test that the frozen weights are only written once with the `IncrementalCheckpointIO`."""
+
+    class FrozenBackboneModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.backbone = torch.nn.Linear(32, 32)
+            self.backbone.requires_grad_(False)
+
+        def forward(self, x):
+            return super().forward(self.backbone(x))
+
+        def configure_optimizers(self):
+            return torch.optim.SGD(self.layer.parameters(), lr=0.1)
+
+    model = FrozenBackboneModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[IncrementalCheckpointIO()],
+        callbacks=ModelCheckpoint(dirpath=tmpdir, save_top_k=-1, every_n_train_steps=1),
+        max_steps=3,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer.fit(model)
+
+    ckpt_paths = sorted(str(p) for p in Path(tmpdir).glob("*.ckpt"))
+    assert len(ckpt_paths) == 3
+    num_tensors = 0
+    for ckpt_path in ckpt_paths:
+        with open(os.path.join(ckpt_path, "index.json")) as f:
+            num_tensors += len(json.load(f)["tensors"])
+    # the backbone weight and bias are written once and shared by all 3 checkpoints
+    assert len(os.listdir(tmpdir / ".tensors")) <= num_tensors - 2 * 2
+
+    loaded = FrozenBackboneModel.load_from_checkpoint(ckpt_paths[-1])
+    for expected, actual in zip(model.parameters(), loaded.parameters()):
+        assert torch.equal(expected, actual)
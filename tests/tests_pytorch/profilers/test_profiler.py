@@ -28,6 +28,7 @@ from pytorch_lightning.demos.boring_classes import BoringModel, ManualOptimBorin
 from pytorch_lightning.loggers import CSVLogger, TensorBoardLogger
 from pytorch_lightning.profilers import AdvancedProfiler, PassThroughProfiler, PyTorchProfiler, SimpleProfiler
 from pytorch_lightning.profilers.pytorch import RegisterRecordFunction, warning_cache
+from pytorch_lightning.profilers.simple import _DurationStats
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _KINETO_AVAILABLE
 from tests_pytorch.helpers.runif import RunIf
@@ -258,6 +259,65 @@ def test_simple_profiler_summary(tmpdir, extended):
     assert expected_text == summary
 
 
+def test_simple_profiler_streaming_stats():
+    """Test the streaming aggregates against the exact statistics of the durations."""
+    durations = np.random.RandomState(0).lognormal(mean=-5, sigma=1, size=10_000)
+    stats = _DurationStats()
+    for duration in durations:
+        stats.add(duration)
+    stats.add(0.0)
+    durations = np.append(durations, 0.0)
+
+    assert stats.count == len(durations)
+    assert stats.total == pytest.approx(durations.sum())
+    assert stats.mean == pytest.approx(durations.mean())
+    assert stats.std == pytest.approx(durations.std())
+    assert stats.min == 0.0
+    assert stats.max == durations.max()
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert stats.quantile(q) == pytest.approx(np.quantile(durations, q, method="lower"), rel=0.02)
+
+    # the number of buckets is bounded, the lowest ones are merged
+    stats = _DurationStats(max_buckets=8)
+    for duration in durations:
+        stats.add(duration)
+    assert len(stats._buckets) <= 8
+    assert stats.quantile(1.0) == pytest.approx(durations.max(), rel=0.02)
+
+
+def test_simple_profiler_streaming(tmpdir):
+    """Test that the streaming mode reports the same summary and sends snapshots to the loggers."""
+    with pytest.raises(ValueError, match="requires `streaming=True`"):
+        SimpleProfiler(snapshot_interval=1.0)
+    with pytest.raises(ValueError, match="requires `streaming=True`"):
+        SimpleProfiler().snapshot()
+
+    profiler = SimpleProfiler(streaming=True, snapshot_interval=0.0)
+    logger = CSVLogger(tmpdir)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=2,
+        limit_val_batches=0,
+        profiler=profiler,
+        logger=logger,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    with patch.object(logger, "log_metrics", wraps=logger.log_metrics) as log_metrics:
+        trainer.fit(BoringModel())
+
+    assert isinstance(profiler.recorded_durations["run_training_epoch"], _DurationStats)
+    assert profiler.recorded_durations["run_training_batch"].count == 2
+    snapshots = [c.args[0] for c in log_metrics.call_args_list if "profiler/run_training_batch/count" in c.args[0]]
+    assert snapshots
+    assert snapshots[-1]["profiler/run_training_batch/count"] == 2
+    assert {"total", "mean", "std", "min", "max", "p50", "p99"} <= {
+        key.rsplit("/", 1)[1] for key in snapshots[-1] if key.startswith("profiler/run_training_batch/")
+    }
+    assert "run_training_batch" in profiler.summary()
+
+
 @pytest.fixture
 def advanced_profiler(tmpdir):
     return AdvancedProfiler(dirpath=tmpdir, filename="profiler")
@@ -61,6 +61,49 @@ def test_tensor_running_accum_reset():
     assert not accum.rotated
 
 
+@pytest.mark.parametrize("window_length", [1, 3, 10])
+def test_tensor_running_accum_windows(window_length):
+    """Test the running statistics against the values stored in the window."""
+    accum = TensorRunningAccum(window_length=window_length)
+    for step in range(2):
+        values = []
+        for i in range(2 * window_length + 1):
+            value = float((i * 7) % 5 - step)
+            values.append(value)
+            accum.append(torch.tensor(value))
+            for window in range(1, window_length + 2):
+                expected = values[-min(window, window_length) :]
+                assert accum.mean(window=window) == pytest.approx(sum(expected) / len(expected))
+                assert accum.min(window=window) == min(expected)
+                assert accum.max(window=window) == max(expected)
+            assert accum.mean() == pytest.approx(sum(values[-window_length:]) / len(values[-window_length:]))
+        # the buffers are reused after a reset
+        memory = accum.memory
+        accum.reset()
+        assert accum.mean() is None
+        accum.append(torch.tensor(1.0))
+        assert accum.memory is memory
+        accum.reset()
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        accum.append(torch.tensor(1.0))
+        accum.mean(window=0)
+
+
+@pytest.mark.parametrize("bad_value", [float("inf"), float("nan")])
+def test_tensor_running_accum_non_finite(bad_value):
+    """Test that a non-finite value only affects the means of the windows that contain it."""
+    accum = TensorRunningAccum(window_length=4)
+    values = [1.0, 2.0, bad_value, 3.0, 4.0, 5.0, 6.0]
+    for i, value in enumerate(values):
+        accum.append(torch.tensor(value))
+        for window in range(1, 5):
+            expected = torch.tensor(values[max(0, i + 1 - window) : i + 1]).mean()
+            torch.testing.assert_close(accum.mean(window=window), expected, equal_nan=True)
+    assert accum.mean() == 4.5
+    assert accum.mean(window=1) == 6.0
+
+
 def test_cycle_iterator():
     """Test the cycling function of `CycleIterator`"""
 